@@ -2,9 +2,32 @@
 AI Helper module for Neon Tetris
 Provides AI-based suggestions for optimal piece placement
 """
-import copy
-from src.board import Board
-from src.tetromino import Tetromino
+import functools
+import numpy as np
+from src.board import Board, place_cells
+from src.tetromino import Tetromino, ROTATION_META
+
+def _rotation_arrays(meta):
+    """
+    Convert rotation metadata into the arrays used by the batched evaluation
+    Returns: (columns, tops, bottoms, piece_rows) where piece_rows holds
+    (row offset, filled cells) pairs
+    """
+    columns = np.array(list(meta['bottom_by_col']))
+    tops = np.array(list(meta['top_by_col'].values()))
+    bottoms = np.array(list(meta['bottom_by_col'].values()))
+    
+    row_cells = {}
+    for _, dy in meta['cells']:
+        row_cells[dy] = row_cells.get(dy, 0) + 1
+    
+    return columns, tops, bottoms, tuple(sorted(row_cells.items()))
+
+# Batched evaluation arrays for every shape and rotation
+_ROTATION_ARRAYS = {
+    name: tuple(_rotation_arrays(meta) for meta in metas)
+    for name, metas in ROTATION_META.items()
+}
 
 class AIHelper:
     def __init__(self):
@@ -16,167 +39,189 @@ class AIHelper:
             'holes': -0.35663,
             'bumpiness': -0.184483
         }
+        
+        # Number of placements expanded by the two-piece lookahead
+        self.lookahead_beam = 8
+        
+        # Search results keyed by the board contents and piece kinds; the key
+        # fully describes the search so entries never need invalidating
+        self._cached_best_move = functools.lru_cache(maxsize=4096)(self._best_move_for)
     
-    def get_best_move(self, board, current_piece):
+    def get_best_move(self, board, current_piece, next_piece=None):
         """
         Find the best move for the current piece
+        When the next piece is given, each move is judged by the best follow-up
+        placement of the next piece (two-piece lookahead)
+        Returns: (best_x, best_rotation, best_score, landing_y)
+        """
+        return self._cached_best_move(
+            board.grid.tobytes(), board.height, board.width, current_piece.shape_name,
+            next_piece.shape_name if next_piece else None
+        )
+    
+    def cache_info(self):
+        """Get the hit/miss statistics of the search cache"""
+        return self._cached_best_move.cache_info()
+    
+    def _best_move_for(self, grid_bytes, height, width, shape_name, next_shape_name):
+        """Rebuild the board from its bytes and run the search"""
+        board = Board(width, height)
+        board.grid = np.frombuffer(grid_bytes, dtype=np.uint8).reshape(height, width)
+        
+        if next_shape_name is None:
+            return self._search(board, shape_name)
+        return self._search_lookahead(board, shape_name, next_shape_name)
+    
+    def _search(self, board, shape_name):
+        """
+        Search every rotation and position of a piece kind on the board
         Returns: (best_x, best_rotation, best_score, landing_y)
         """
+        features = self._board_features(board)
+        results = [
+            self._best_for_rotation(board, shape_name, rotation, features)
+            for rotation in range(len(ROTATION_META[shape_name]))
+        ]
+        
+        # The first rotation with the highest score wins, as in a sequential scan
+        best_rotation = max(range(len(results)), key=lambda rotation: results[rotation][0])
+        best_score, best_x, best_landing_y = results[best_rotation]
+        if best_score == float('-inf'):
+            return 0, 0, best_score, 0
+        
+        return best_x, best_rotation, best_score, best_landing_y
+    
+    def _best_for_rotation(self, board, shape_name, rotation, features):
+        """
+        Find the best position for one rotation of a piece kind
+        Returns: (score, x, landing_y), with a score of -inf if nothing fits
+        """
+        xs, landing_ys, scores = self._evaluate_rotation(board, shape_name, rotation, *features)
+        if not len(scores):
+            return float('-inf'), 0, 0
+        
+        # argmax keeps the leftmost position on ties
+        index = int(scores.argmax())
+        return float(scores[index]), int(xs[index]), int(landing_ys[index])
+    
+    def _search_lookahead(self, board, shape_name, next_shape_name):
+        """
+        Two-piece search: score each placement of the current piece by the best
+        placement of the next piece on the resulting board
+        Only the most promising placements (by their one-piece score) are expanded
+        Returns: (best_x, best_rotation, best_score, landing_y)
+        """
+        candidates = []
+        for rotation, xs, landing_ys, scores in self._evaluate_all(board, shape_name):
+            for x, landing_y, score in zip(xs.tolist(), landing_ys.tolist(), scores.tolist()):
+                if score > float('-inf'):
+                    candidates.append((score, rotation, x, landing_y))
+        
+        if not candidates:
+            return 0, 0, float('-inf'), 0
+        
+        # Expand the best candidates first; the sort is stable so ties keep search order
+        candidates.sort(key=lambda candidate: candidate[0], reverse=True)
+        
+        # One scratch board per search is reset and reused for every expansion
+        scratch = board.fast_clone()
+        
         best_score = float('-inf')
-        best_x = 0
-        best_rotation = 0
-        best_landing_y = 0
-        
-        # Try all possible rotations and positions
-        for rotation in range(len(current_piece.shape)):
-            # Create a copy of the piece with this rotation
-            test_piece = copy.deepcopy(current_piece)
-            test_piece.rotation = rotation
-            
-            # Get width of the piece in this rotation
-            piece_width = self._get_piece_width(test_piece)
+        best_x, best_rotation, best_landing_y = candidates[0][2], candidates[0][1], candidates[0][3]
+        for _, rotation, x, landing_y in candidates[:self.lookahead_beam]:
+            cleared = self._apply_move(board, scratch, shape_name, rotation, x, landing_y)
+            score = self._search(scratch, next_shape_name)[2] + self.weights['complete_lines'] * cleared
             
-            # Try all possible x positions
-            for x in range(-2, board.width - piece_width + 3):  # Allow slight overhang for rotations
-                # Create a copy of the piece at this position
-                test_piece = copy.deepcopy(current_piece)
-                test_piece.rotation = rotation
-                test_piece.x = x
-                test_piece.y = 0
-                
-                # Skip if invalid position
-                if board.is_collision(test_piece):
-                    continue
-                
-                # Simulate dropping the piece
-                landing_y = self._simulate_drop(board, test_piece)
-                
-                # Create a copy of the board with the piece placed
-                test_board = copy.deepcopy(board)
-                test_piece.y = landing_y
-                
-                # Skip if invalid final position (shouldn't happen but just in case)
-                if test_board.is_collision(test_piece):
-                    continue
-                
-                # Place the piece on the test board
-                test_board.place_piece(test_piece)
-                
-                # Calculate score for this move
-                score = self._evaluate_board(test_board)
-                
-                # Update best move if this is better
-                if score > best_score:
-                    best_score = score
-                    best_x = x
-                    best_rotation = rotation
-                    best_landing_y = landing_y
+            if score > best_score:
+                best_score = score
+                best_x = x
+                best_rotation = rotation
+                best_landing_y = landing_y
         
         return best_x, best_rotation, best_score, best_landing_y
     
-    def _get_piece_width(self, piece):
-        """Get the effective width of a piece in its current rotation"""
-        shape = piece.get_current_rotation()
-        width = len(shape[0])
-        
-        # Trim empty columns from left and right
-        min_x = width
-        max_x = 0
-        
-        for y in range(len(shape)):
-            for x in range(width):
-                if shape[y][x]:
-                    min_x = min(min_x, x)
-                    max_x = max(max_x, x)
-        
-        return max_x - min_x + 1 if min_x <= max_x else 0
+    def _evaluate_all(self, board, shape_name):
+        """
+        Score every rotation and position of a piece kind on the board
+        Yields: (rotation, xs, landing_ys, scores) for each rotation
+        """
+        features = self._board_features(board)
+        for rotation in range(len(ROTATION_META[shape_name])):
+            xs, landing_ys, scores = self._evaluate_rotation(board, shape_name, rotation, *features)
+            yield rotation, xs, landing_ys, scores
     
-    def _simulate_drop(self, board, piece):
-        """Simulate dropping a piece and return the landing y-coordinate"""
-        while not board.is_collision(piece):
-            piece.y += 1
-        
-        # Move back up one step (to the last valid position)
-        piece.y -= 1
-        return piece.y
+    def _board_features(self, board):
+        """
+        Compute everything the heuristics need from the starting board, once per search
+        Returns: (heights, row_counts, row_fills, holes, complete_lines) where
+        row_fills is the set of distinct filled-cell counts over the rows
+        """
+        heights = board.column_heights()
+        row_counts = np.count_nonzero(board.grid, axis=1)
+        row_fills = frozenset(row_counts.tolist())
+        holes = board.count_holes(heights)
+        complete_lines = self._count_complete_lines(board)
+        return heights, row_counts, row_fills, holes, complete_lines
     
-    def _evaluate_board(self, board):
+    def _apply_move(self, board, scratch, shape_name, rotation, x, landing_y):
         """
-        Evaluate a board state using heuristics
-        Returns a score (higher is better)
+        Reset the scratch board to the board, drop a piece onto it and clear
+        completed lines
+        Returns the number of lines cleared
         """
-        # Calculate aggregate height
-        heights = self._get_column_heights(board)
-        aggregate_height = sum(heights)
+        np.copyto(scratch.grid, board.grid)
+        place_cells(scratch.grid, None, ROTATION_META[shape_name][rotation]['cells'], 0, x, landing_y)
+        return scratch.clear_lines()
+    
+    def _evaluate_rotation(self, board, shape_name, rotation, heights, row_counts, row_fills,
+                           base_holes, base_lines):
+        """
+        Score every x position of one rotation without touching the grid
+        Dropping a piece only changes the columns it lands in, so each heuristic
+        is the starting board's value plus a per-column delta
+        Returns: (xs, landing_ys, scores) arrays, unplayable positions scored -inf
+        """
+        columns, tops, bottoms, piece_rows = _ROTATION_ARRAYS[shape_name][rotation]
         
-        # Calculate complete lines
-        complete_lines = self._count_complete_lines(board)
+        # Every x that keeps the piece inside the board horizontally
+        xs = np.arange(-columns[0], board.width - columns[-1])
+        board_columns = xs[:, None] + columns
+        column_heights = heights[board_columns]
         
-        # Calculate holes
-        holes = self._count_holes(board, heights)
+        # Dropped straight down, the piece stops on the first column top it meets
+        landing_ys = (board.height - column_heights - 1 - bottoms).min(axis=1)
         
-        # Calculate bumpiness (sum of differences between adjacent columns)
-        bumpiness = sum(abs(heights[i] - heights[i+1]) for i in range(len(heights)-1))
+        # Column heights after the drop: the piece is now the top of its columns
+        new_heights = np.repeat(heights[None, :], len(xs), axis=0)
+        new_heights[np.arange(len(xs))[:, None], board_columns] = (
+            board.height - landing_ys[:, None] - tops
+        )
         
-        # Calculate final score using weights
-        score = (
-            self.weights['aggregate_height'] * aggregate_height +
+        # Every empty cell between the piece and the old column top becomes a hole
+        holes = base_holes + (
+            board.height - column_heights - landing_ys[:, None] - bottoms - 1
+        ).sum(axis=1)
+        
+        # A row completes when the piece fills exactly its remaining gaps; piece
+        # rows that cannot complete any row of this board are skipped
+        complete_lines = np.full(len(xs), base_lines)
+        rows = np.maximum(landing_ys, 0)
+        for dy, count in piece_rows:
+            if board.width - count in row_fills:
+                complete_lines += (row_counts[rows + dy] + count == board.width)
+        
+        scores = (
+            self.weights['aggregate_height'] * new_heights.sum(axis=1) +
             self.weights['complete_lines'] * complete_lines +
             self.weights['holes'] * holes +
-            self.weights['bumpiness'] * bumpiness
+            self.weights['bumpiness'] * np.abs(np.diff(new_heights, axis=1)).sum(axis=1)
         )
         
-        return score
-    
-    def _get_column_heights(self, board):
-        """Get the height of each column (highest block in each column)"""
-        heights = [0] * board.width
+        # Skip positions where the piece does not fit below the spawn row
+        scores[landing_ys < 0] = float('-inf')
         
-        for x in range(board.width):
-            for y in range(board.height):
-                if board.grid[y][x]:
-                    heights[x] = board.height - y
-                    break
-        
-        return heights
+        return xs, landing_ys, scores
     
     def _count_complete_lines(self, board):
         """Count the number of complete lines in the board"""
-        complete_lines = 0
-        
-        for y in range(board.height):
-            if all(board.grid[y]):
-                complete_lines += 1
-        
-        return complete_lines
-    
-    def _count_holes(self, board, heights):
-        """
-        Count the number of holes in the board
-        A hole is an empty cell with at least one filled cell above it in the same column
-        """
-        holes = 0
-        
-        for x in range(board.width):
-            # Find the highest block in this column
-            top_block_y = board.height
-            for y in range(board.height):
-                if board.grid[y][x]:
-                    top_block_y = y
-                    break
-            
-            # Count holes below the highest block
-            for y in range(top_block_y + 1, board.height):
-                if not board.grid[y][x]:
-                    holes += 1
-        
-        return holes
-    
-    def get_ghost_piece(self, board, piece):
-        """
-        Create a ghost piece showing where the current piece would land
-        Returns a copy of the piece at its landing position
-        """
-        ghost = copy.deepcopy(piece)
-        ghost.y = self._simulate_drop(board, copy.deepcopy(piece))
-        return ghost
+        return int(board.grid.all(axis=1).sum())
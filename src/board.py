@@ -2,75 +2,145 @@
 Board class - Represents the Tetris game board
 """
 import pygame
-import copy
+import numpy as np
+
+def pack_color(color):
+    """Pack an (r, g, b) color into a single integer 0xRRGGBB"""
+    r, g, b = color
+    return (r << 16) | (g << 8) | b
+
+def rows_collide(row_bits, width, height, row_masks, bounds, x, y, check_walls=True):
+    """
+    Check if a shape placed at (x, y) hits a wall, the floor or a filled cell
+    row_bits holds one integer per board row with bit x set for filled cells,
+    row_masks the (dy, mask) rows of the shape and bounds its (min_x, max_x, ...)
+    Rows above the top of the board only collide with the walls, and callers
+    that only moved a valid piece down can skip the wall checks
+    """
+    if check_walls and (x + bounds[0] < 0 or x + bounds[1] >= width):
+        return True
+    
+    for dy, mask in row_masks:
+        board_y = y + dy
+        if board_y >= height:
+            return True
+        # A negative x only shifts out empty columns once the walls are checked
+        if board_y >= 0 and row_bits[board_y] & (mask << x if x >= 0 else mask >> -x):
+            return True
+    return False
+
+def drop_row(row_bits, height, row_masks, x, y):
+    """
+    Get the lowest row a shape at (x, y) reaches when dropped straight down
+    The shape's row masks are shifted into place once, so each step down is
+    only a few integer ANDs
+    """
+    shifted = [(dy, mask << x if x >= 0 else mask >> -x) for dy, mask in row_masks]
+    while True:
+        next_y = y + 1
+        for dy, mask in shifted:
+            board_y = next_y + dy
+            if board_y >= height or (board_y >= 0 and row_bits[board_y] & mask):
+                return y
+        y = next_y
+
+def place_cells(grid, colors_packed, cells, color, x, y):
+    """
+    Write shape cells placed at (x, y) into the grid (and colors, unless None)
+    Returns the (y, x) cells written; cells outside the grid are skipped
+    """
+    height, width = grid.shape
+    placed = []
+    for dx, dy in cells:
+        board_x = x + dx
+        board_y = y + dy
+        if 0 <= board_y < height and 0 <= board_x < width:
+            grid[board_y, board_x] = 1
+            if colors_packed is not None:
+                colors_packed[board_y, board_x] = color
+            placed.append((board_y, board_x))
+    return placed
 
 class Board:
     def __init__(self, width=10, height=20):
         """Initialize the game board"""
         self.width = width
         self.height = height
-        self.grid = [[0 for _ in range(width)] for _ in range(height)]
-        self.colors = [[None for _ in range(width)] for _ in range(height)]
+        self.grid = np.zeros((height, width), dtype=np.uint8)
+        # Cell colors packed as 0xRRGGBB, 4 bytes per cell
+        self.colors_packed = np.zeros((height, width), dtype=np.uint32)
+        
+        # Bumped on every change to the cells so views of the board can be cached
+        self.version = 0
+        
+        # Row bitboards for collision tests, rebuilt when the version changes
+        self._row_bits = None
+        self._row_bits_version = None
     
-    def is_collision(self, tetromino):
+    def row_bits(self):
+        """
+        Get every row as an integer with bit x set for each filled cell
+        Derived from the grid and cached until the board version changes
+        """
+        if self._row_bits_version != self.version:
+            weights = 1 << np.arange(self.width, dtype=np.int64)
+            self._row_bits = ((self.grid != 0) @ weights).tolist()
+            self._row_bits_version = self.version
+        return self._row_bits
+    
+    def is_collision(self, tetromino, check_walls=True):
         """
         Check if tetromino collides with the board or other pieces
         Returns True if collision detected, False otherwise
+        check_walls can be turned off when the piece is known to be within the walls
+        """
+        return self.is_collision_at(tetromino.meta(), tetromino.x, tetromino.y, check_walls)
+    
+    def is_collision_at(self, meta, x, y, check_walls=True):
+        """
+        Check if a shape rotation, given by its metadata, would collide at (x, y)
+        Lets callers test candidate positions without moving the piece
         """
-        shape = tetromino.get_current_rotation()
-        for y, row in enumerate(shape):
-            for x, cell in enumerate(row):
-                if cell:
-                    # Calculate board coordinates
-                    board_x = tetromino.x + x
-                    board_y = tetromino.y + y
-                    
-                    # Check if out of bounds or colliding with placed pieces
-                    if (board_x < 0 or board_x >= self.width or 
-                        board_y >= self.height or 
-                        (board_y >= 0 and self.grid[board_y][board_x])):
-                        return True
-        return False
+        return rows_collide(
+            self.row_bits(), self.width, self.height, meta['row_masks'], meta['bounds'],
+            x, y, check_walls
+        )
+    
+    def drop_y(self, tetromino):
+        """Get the row the tetromino lands on when dropped straight down"""
+        return drop_row(self.row_bits(), self.height, tetromino.meta()['row_masks'], tetromino.x, tetromino.y)
     
     def place_piece(self, tetromino):
         """
         Place the tetromino on the board
-        Updates the grid and colors arrays
-        """
-        shape = tetromino.get_current_rotation()
-        for y, row in enumerate(shape):
-            for x, cell in enumerate(row):
-                if cell:
-                    board_x = tetromino.x + x
-                    board_y = tetromino.y + y
-                    
-                    # Only place cells that are within the board
-                    if 0 <= board_y < self.height and 0 <= board_x < self.width:
-                        self.grid[board_y][board_x] = 1
-                        self.colors[board_y][board_x] = tetromino.color
+        Updates the grid and colors arrays and returns the (y, x) cells written
+        """
+        self.version += 1
+        return place_cells(
+            self.grid, self.colors_packed, tetromino.meta()['cells'],
+            pack_color(tetromino.color), tetromino.x, tetromino.y
+        )
     
     def clear_lines(self):
         """
         Clear completed lines and return the number of lines cleared
-        Moves all lines above the cleared line down
+        Moves all lines above the cleared lines down
         """
-        lines_cleared = 0
-        y = self.height - 1
+        full = self.grid.all(axis=1)
+        lines_cleared = int(full.sum())
         
-        while y >= 0:
-            if all(self.grid[y]):
-                # Line is complete, remove it
-                for y2 in range(y, 0, -1):
-                    self.grid[y2] = self.grid[y2 - 1][:]
-                    self.colors[y2] = self.colors[y2 - 1][:]
-                
-                # Clear the top line
-                self.grid[0] = [0] * self.width
-                self.colors[0] = [None] * self.width
-                
-                lines_cleared += 1
-            else:
-                y -= 1
+        if lines_cleared:
+            self.version += 1
+            
+            # Compact the remaining rows to the bottom, keeping their order,
+            # and empty the rows freed up at the top
+            keep = ~full
+            self.grid[lines_cleared:] = self.grid[keep]
+            self.grid[:lines_cleared] = 0
+            
+            if self.colors_packed is not None:
+                self.colors_packed[lines_cleared:] = self.colors_packed[keep]
+                self.colors_packed[:lines_cleared] = 0
         
         return lines_cleared
     
@@ -79,53 +149,58 @@ class Board:
         Get the height profile of the board
         Returns a list where each element is the height of a column
         """
-        heights = [0] * self.width
-        
-        for x in range(self.width):
-            for y in range(self.height):
-                if self.grid[y][x]:
-                    heights[x] = self.height - y
-                    break
-        
-        return heights
+        return self.column_heights().tolist()
     
-    def count_holes(self):
+    def count_holes(self, heights=None):
         """
         Count the number of holes in the board
         A hole is an empty cell with at least one filled cell above it
+        heights are the column heights, computed if not given
         """
-        holes = 0
+        if heights is None:
+            heights = self.column_heights()
         
-        for x in range(self.width):
-            found_block = False
-            for y in range(self.height):
-                if self.grid[y][x]:
-                    found_block = True
-                elif found_block:
-                    # This is a hole - empty cell with a block above it
-                    holes += 1
-        
-        return holes
+        # Every filled cell lies at or below its column top, so whatever is
+        # left of the column heights after removing the filled cells is holes
+        return int(heights.sum()) - int(np.count_nonzero(self.grid))
     
     def get_aggregate_height(self):
         """
         Calculate the sum of all column heights
         """
-        return sum(self.get_height_profile())
+        return int(self.column_heights().sum())
     
     def get_bumpiness(self):
         """
         Calculate the sum of differences between adjacent columns
         """
-        heights = self.get_height_profile()
-        return sum(abs(heights[i] - heights[i+1]) for i in range(len(heights)-1))
+        return int(np.abs(np.diff(self.column_heights())).sum())
+    
+    def column_heights(self):
+        """Get the height of each column as an array (0 for empty columns)"""
+        filled = self.grid != 0
+        # argmax finds the first filled row; empty columns are masked to 0
+        return np.where(filled.any(axis=0), self.height - filled.argmax(axis=0), 0)
     
-    def clone(self):
+    def clone(self, grid_only=False):
+        """
+        Create a copy of the board
+        Useful for AI simulations; with grid_only the colors are not copied
+        (the AI never reads them) and the clone has colors_packed set to None
+        """
+        new_board = Board.__new__(Board)
+        new_board.width = self.width
+        new_board.height = self.height
+        new_board.version = self.version
+        new_board._row_bits = None
+        new_board._row_bits_version = None
+        new_board.grid = self.grid.copy()
+        new_board.colors_packed = None if grid_only else self.colors_packed.copy()
+        return new_board
+    
+    def fast_clone(self):
         """
-        Create a deep copy of the board
-        Useful for AI simulations
+        Create a grid-only copy of the board
+        Safe to hand to another thread since the grid array is not shared
         """
-        new_board = Board(self.width, self.height)
-        new_board.grid = copy.deepcopy(self.grid)
-        new_board.colors = copy.deepcopy(self.colors)
-        return new_board
+        return self.clone(grid_only=True)
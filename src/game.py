@@ -2,8 +2,8 @@
 Game class - Main game logic for Neon Tetris
 """
 import pygame
-import copy
 import time
+from concurrent.futures import ThreadPoolExecutor
 from src.tetromino import Tetromino
 from src.board import Board
 from src.ai_helper import AIHelper
@@ -28,6 +28,9 @@ class Game:
         
         pygame.display.set_caption("Neon Tetris")
         
+        # The game never reads mouse motion or focus events, so SDL need not queue them
+        pygame.event.set_blocked([pygame.MOUSEMOTION, pygame.ACTIVEEVENT])
+        
         # Initialize components
         self.theme_manager = ThemeManager()
         self.ai_helper = AIHelper()
@@ -55,6 +58,18 @@ class Game:
         self.ai_suggestion = None
         self.ai_ghost_piece = None
         
+        # Landing row of the current piece, cached by piece position and board version
+        self._ghost_key = None
+        self._ghost_y = 0
+        
+        # The AI search runs on a worker thread so it never stalls a frame
+        self._ai_pool = ThreadPoolExecutor(max_workers=1)
+        self._ai_future = None
+        
+        # Paused and game over screens are static, so they are only redrawn
+        # after something changed
+        self._needs_redraw = True
+        
         # Game timing
         self.clock = pygame.time.Clock()
         self.drop_time = 0
@@ -90,31 +105,82 @@ class Game:
             self._calculate_ai_suggestion()
     
     def _calculate_ai_suggestion(self):
-        """Calculate the AI's suggested move"""
-        best_x, best_rotation, _, best_y = self.ai_helper.get_best_move(self.board, self.current_piece)
+        """Start calculating the AI's suggested move on the worker thread"""
+        # Any search still running is for a piece that is no longer current
+        self._cancel_ai_suggestion()
+        
+        # The worker gets its own copies so the game can keep changing them
+        self._ai_future = self._ai_pool.submit(
+            self.ai_helper.get_best_move,
+            self.board.fast_clone(),
+            self.current_piece.fast_clone(),
+            self.next_piece.fast_clone()
+        )
+    
+    def _cancel_ai_suggestion(self):
+        """Drop the pending AI search, if any"""
+        if self._ai_future:
+            self._ai_future.cancel()
+            self._ai_future = None
+    
+    def _poll_ai_suggestion(self):
+        """Pick up the AI's suggested move once the worker has finished"""
+        if not self._ai_future or not self._ai_future.done():
+            return
+        
+        best_x, best_rotation, _, best_y = self._ai_future.result()
+        self._ai_future = None
         
         # Create a ghost piece for the AI suggestion
         self.ai_suggestion = (best_x, best_rotation)
         
         # Create a ghost piece to show the suggestion
-        self.ai_ghost_piece = copy.deepcopy(self.current_piece)
+        self.ai_ghost_piece = self.current_piece.fast_clone()
         self.ai_ghost_piece.x = best_x
         self.ai_ghost_piece.rotation = best_rotation
         self.ai_ghost_piece.y = best_y
     
-    def _create_ghost_piece(self):
-        """Create a ghost piece showing where the current piece would land"""
-        if not self.ghost_piece_enabled:
-            return None
-            
-        return self.ai_helper.get_ghost_piece(self.board, self.current_piece)
+    def _get_ghost_y(self):
+        """Get the row of the ghost piece showing where the current piece would land"""
+        piece = self.current_piece
+        
+        # Only recompute when the piece moved or the board changed
+        ghost_key = (self.board, self.board.version, piece.shape_name, piece.rotation, piece.x, piece.y)
+        if ghost_key != self._ghost_key:
+            self._ghost_key = ghost_key
+            # The same landing row a hard drop moves the piece to
+            self._ghost_y = self.board.drop_y(piece)
+        
+        return self._ghost_y
     
     def _handle_events(self):
         """Process game events"""
-        for event in pygame.event.get():
+        # Bind frequently used callables once rather than per key press
+        get_ticks = pygame.time.get_ticks
+        play_sound = self.theme_manager.play_sound
+        
+        # Only fetch the events the game reacts to and drop the rest, so they
+        # neither cost a Python event object each nor pile up in the queue
+        # (expose events are kept so a static screen is redrawn when uncovered);
+        # the queue was just pumped, so clearing must not pump it again or
+        # events arriving in between would be dropped unseen
+        events = pygame.event.get([pygame.QUIT, pygame.KEYDOWN, pygame.VIDEORESIZE, pygame.VIDEOEXPOSE])
+        pygame.event.clear(pump=False)
+        if events:
+            self._needs_redraw = True
+        
+        # Consecutive presses along one axis are applied as a single move
+        pending_dx = 0
+        pending_dy = 0
+        
+        for event in events:
             if event.type == pygame.QUIT:
                 return False
             
+            # The uncovered window needs every pixel, not just the changes
+            if event.type == pygame.VIDEOEXPOSE:
+                self.renderer.invalidate()
+            
             # Handle window resize
             if event.type == pygame.VIDEORESIZE:
                 if not self.fullscreen:
@@ -123,65 +189,102 @@ class Game:
                     self.renderer.update_screen_size(self.screen)
             
             if event.type == pygame.KEYDOWN:
+                key = event.key
                 if self.game_over:
                     # Game over state controls
-                    if event.key == pygame.K_r:
+                    if key == pygame.K_r:
                         self._reset_game()
-                    elif event.key == pygame.K_q:
+                    elif key == pygame.K_q:
                         return False
-                    elif event.key == pygame.K_ESCAPE:
+                    elif key == pygame.K_ESCAPE:
                         return "menu"  # Return to menu
                 elif self.paused:
                     # Paused state controls
-                    if event.key == pygame.K_p:
+                    if key == pygame.K_p:
                         self.paused = False
-                    elif event.key == pygame.K_ESCAPE:
+                    elif key == pygame.K_ESCAPE:
                         return "menu"  # Return to menu
+                elif key in (pygame.K_LEFT, pygame.K_RIGHT):
+                    # Queue horizontal moves, applying any queued soft drop first
+                    self._apply_moves(0, pending_dy)
+                    pending_dy = 0
+                    pending_dx += -1 if key == pygame.K_LEFT else 1
+                elif key == pygame.K_DOWN:
+                    # Queue soft drops, applying any queued horizontal moves first
+                    self._apply_moves(pending_dx, 0)
+                    pending_dx = 0
+                    pending_dy += 1
                 else:
+                    # Every other key acts on the piece after the queued moves
+                    self._apply_moves(pending_dx, pending_dy)
+                    pending_dx = 0
+                    pending_dy = 0
+                    
+                    # The piece is replaced after a hard drop, so bind it per event
+                    piece = self.current_piece
+                    board = self.board
+                    
                     # Active game controls
-                    if event.key == pygame.K_LEFT:
-                        self.current_piece.move_left(self.board)
-                        self.theme_manager.play_sound('move')
-                        self.last_move_time = pygame.time.get_ticks()
-                    elif event.key == pygame.K_RIGHT:
-                        self.current_piece.move_right(self.board)
-                        self.theme_manager.play_sound('move')
-                        self.last_move_time = pygame.time.get_ticks()
-                    elif event.key == pygame.K_DOWN:
-                        self.current_piece.move_down(self.board)
-                        self.theme_manager.play_sound('move')
-                        self.last_move_time = pygame.time.get_ticks()
-                    elif event.key == pygame.K_UP:
-                        if self.current_piece.rotate(self.board):
-                            self.theme_manager.play_sound('rotate')
-                            self.last_move_time = pygame.time.get_ticks()
-                    elif event.key == pygame.K_SPACE:
-                        self.current_piece.hard_drop(self.board)
-                        self.theme_manager.play_sound('drop')
+                    if key == pygame.K_UP:
+                        if piece.rotate(board):
+                            play_sound('rotate')
+                            self.last_move_time = get_ticks()
+                    elif key == pygame.K_SPACE:
+                        piece.hard_drop(board)
+                        play_sound('drop')
                         self._place_current_piece()
-                    elif event.key == pygame.K_p:
+                    elif key == pygame.K_p:
                         self.paused = True
-                    elif event.key == pygame.K_a:
+                    elif key == pygame.K_a:
                         self.ai_helper_enabled = not self.ai_helper_enabled
                         if self.ai_helper_enabled:
                             self._calculate_ai_suggestion()
-                    elif event.key == pygame.K_g:
+                        else:
+                            self._cancel_ai_suggestion()
+                    elif key == pygame.K_g:
                         self.ghost_piece_enabled = not self.ghost_piece_enabled
-                    elif event.key == pygame.K_t:
+                    elif key == pygame.K_t:
                         new_theme = self.theme_manager.cycle_theme()
                         # Update piece colors for the new theme
                         self.current_piece.update_colors(self.theme_manager.current_theme['piece_colors'])
                         self.next_piece.update_colors(self.theme_manager.current_theme['piece_colors'])
                         # Load theme-specific music
                         self.theme_manager.load_music()
-                    elif event.key == pygame.K_f:
+                    elif key == pygame.K_f:
                         # Toggle fullscreen
                         self.toggle_fullscreen()
-                    elif event.key == pygame.K_ESCAPE:
+                    elif key == pygame.K_ESCAPE:
                         self.paused = True
         
+        self._apply_moves(pending_dx, pending_dy)
         return True
     
+    def _apply_moves(self, dx, dy):
+        """
+        Move the current piece dx columns sideways, then dy rows down
+        Each direction stops at the first blocked step
+        """
+        if not dx and not dy:
+            return
+        
+        # Bind what the moves use once, as _handle_events does
+        piece = self.current_piece
+        board = self.board
+        play_sound = self.theme_manager.play_sound
+        get_ticks = pygame.time.get_ticks
+        
+        step = piece.move_left if dx < 0 else piece.move_right
+        for _ in range(abs(dx)):
+            if not step(board):
+                break
+        move_down = piece.move_down
+        for _ in range(dy):
+            if not move_down(board):
+                break
+        
+        play_sound('move')
+        self.last_move_time = get_ticks()
+    
     def toggle_fullscreen(self):
         """Toggle between fullscreen and windowed mode"""
         self.fullscreen = not self.fullscreen
@@ -198,6 +301,7 @@ class Game:
         
         # Update renderer with new screen size
         self.renderer.update_screen_size(self.screen)
+        self._needs_redraw = True
     
     def _place_current_piece(self):
         """Place the current piece on the board and handle consequences"""
@@ -238,11 +342,16 @@ class Game:
         if self.board.is_collision(self.current_piece):
             self.game_over = True
             self.theme_manager.play_sound('game_over')
+        
+        self._needs_redraw = True
     
     def _update(self):
         """Update game state"""
         if self.paused or self.game_over:
             return
+        
+        # Show the AI suggestion as soon as the worker has it
+        self._poll_ai_suggestion()
             
         current_time = pygame.time.get_ticks()
         
@@ -254,51 +363,52 @@ class Game:
     
     def _draw(self):
         """Draw the game state to the screen"""
+        renderer = self.renderer
+        
         # Clear screen and draw background
-        self.renderer.draw_background()
+        renderer.draw_background()
         
         # Draw board
-        self.renderer.draw_board(self.board)
+        renderer.draw_board(self.board)
         
         if not self.game_over:
             # Draw ghost piece if enabled
             if self.ghost_piece_enabled:
-                ghost_piece = self._create_ghost_piece()
-                if ghost_piece:
-                    self.renderer.draw_ghost_piece(ghost_piece)
+                renderer.draw_ghost_piece(self.current_piece, self._get_ghost_y())
             
             # Draw AI suggestion if enabled
             if self.ai_helper_enabled and self.ai_ghost_piece:
-                self.renderer.draw_ai_suggestion(self.ai_ghost_piece)
+                renderer.draw_ai_suggestion(self.ai_ghost_piece)
             
             # Draw current piece
-            self.renderer.draw_piece(self.current_piece)
+            renderer.draw_piece(self.current_piece)
         
         # Draw next piece preview
-        self.renderer.draw_next_piece(self.next_piece)
+        renderer.draw_next_piece(self.next_piece)
         
         # Draw score, level, and lines cleared
-        self.renderer.draw_score_and_level(self.score, self.level, self.lines_cleared)
+        renderer.draw_score_and_level(self.score, self.level, self.lines_cleared)
         
         # Draw current theme name
-        self.renderer.draw_current_theme()
+        renderer.draw_current_theme()
         
         # Draw AI helper status
-        self.renderer.draw_ai_helper_status(self.ai_helper_enabled)
+        renderer.draw_ai_helper_status(self.ai_helper_enabled)
         
         # Draw controls help
-        self.renderer.draw_controls_help()
+        renderer.draw_controls_help()
         
         # Draw pause screen if paused
         if self.paused:
-            self.renderer.draw_pause_screen()
+            renderer.draw_pause_screen()
         
         # Draw game over screen if game over
         if self.game_over:
-            self.renderer.draw_game_over(self.score)
+            renderer.draw_game_over(self.score)
         
         # Update display
-        pygame.display.flip()
+        renderer.present()
+        self._needs_redraw = False
     
     def _reset_game(self):
         """Reset the game to initial state"""
@@ -321,22 +431,35 @@ class Game:
         # Reset performance tracker
         self.performance_tracker.reset()
         
+        # Discard any search for the previous game
+        self._cancel_ai_suggestion()
+        
         # Initialize game
         self._spawn_piece()
+        self._needs_redraw = True
     
     def run(self):
         """Main game loop"""
         running = True
         
-        while running:
-            result = self._handle_events()
-            if result == "menu":
-                return "menu"
-            elif result is False:
-                running = False
-            
-            self._update()
-            self._draw()
-            self.clock.tick(60)
+        try:
+            while running:
+                result = self._handle_events()
+                if result == "menu":
+                    return "menu"
+                elif result is False:
+                    running = False
+                
+                self._update()
+                
+                # While the piece is falling every frame is drawn; a paused or
+                # finished game is only redrawn after an event changed it, and
+                # the clock still paces the idle loop
+                if self._needs_redraw or not (self.paused or self.game_over):
+                    self._draw()
+                self.clock.tick(60)
+        finally:
+            # The worker thread is not needed once the game loop exits
+            self._ai_pool.shutdown(wait=False, cancel_futures=True)
         
         return "quit"
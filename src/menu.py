@@ -2,9 +2,34 @@
 Menu system for Neon Tetris
 Handles start menu, options, and other UI screens
 """
+import os
 import pygame
+import pygame.freetype
 import sys
 
+# Fonts keyed by (name, size); SysFont searches the system fonts, so each
+# font is only created once however many menus are made
+_FONT_CACHE = {}
+
+def get_font(name, size):
+    """
+    Get a system font, creating it on first use
+    Fonts are pygame.freetype fonts, which cache their glyphs between renders
+    """
+    font = _FONT_CACHE.get((name, size))
+    if font is None:
+        if not pygame.freetype.get_init():
+            pygame.freetype.init()
+        font = pygame.freetype.SysFont(name, size)
+        
+        # pygame.font draws its bundled fallback font smaller than requested;
+        # match it so the menu looks the same when the system font is missing
+        if os.path.basename(font.path) == pygame.freetype.get_default_font():
+            font.size = size * 0.6875
+        
+        _FONT_CACHE[(name, size)] = font
+    return font
+
 class Button:
     def __init__(self, x, y, width, height, text, font, theme_manager, action=None):
         """Initialize a button"""
@@ -14,37 +39,57 @@ class Button:
         self.theme_manager = theme_manager
         self.action = action
         self.hovered = False
+        self.was_hovered = False  # Hover state before the last update
+        
+        # Rendered text and its centered position keyed by (text, color), so a
+        # label is only rasterized and laid out again when it actually changes
+        self._cache = {}
+        
+        # Background with border, keyed by (background, border) color
+        self._faces = {}
     
-    def draw(self, screen):
-        """Draw the button"""
+    def blit_sequence(self):
+        """
+        Get the surfaces that make up the button
+        Returns: [(surface, position), ...] ready for Surface.blits
+        """
         theme = self.theme_manager.current_theme
         
         # Button colors based on hover state
         bg_color = theme['ui_background']
         if self.hovered:
             # Lighter color when hovered
-            r, g, b = theme['ui_color']
-            border_color = (min(255, r + 50), min(255, g + 50), min(255, b + 50))
-            
-            r, g, b = theme['text_color']
-            text_color = (min(255, r + 50), min(255, g + 50), min(255, b + 50))
+            border_color = theme['ui_color_hover']
+            text_color = theme['text_color_hover']
         else:
             border_color = theme['ui_color']
             text_color = theme['text_color']
         
-        # Draw button background
-        pygame.draw.rect(screen, bg_color, self.rect)
+        # Button background and border
+        face_key = (bg_color, border_color)
+        face = self._faces.get(face_key)
+        if face is None:
+            face = pygame.Surface(self.rect.size)
+            face.fill(bg_color)
+            pygame.draw.rect(face, border_color, face.get_rect(), 2)
+            self._faces[face_key] = face
         
-        # Draw button border
-        pygame.draw.rect(screen, border_color, self.rect, 2)
+        # Button text, rendering it only the first time it is seen
+        key = (self.text, text_color)
+        text = self._cache.get(key)
+        if text is None:
+            text_surf, _ = self.font.render(self.text, text_color)
+            text = self._cache[key] = (text_surf, text_surf.get_rect(center=self.rect.center))
         
-        # Draw button text
-        text_surf = self.font.render(self.text, True, text_color)
-        text_rect = text_surf.get_rect(center=self.rect.center)
-        screen.blit(text_surf, text_rect)
+        return [(face, self.rect), text]
+    
+    def draw(self, screen):
+        """Draw the button"""
+        screen.blits(self.blit_sequence(), doreturn=False)
     
     def update(self, mouse_pos):
         """Update button state based on mouse position"""
+        self.was_hovered = self.hovered
         self.hovered = self.rect.collidepoint(mouse_pos)
     
     def handle_event(self, event):
@@ -65,122 +110,127 @@ class Menu:
         self.height = screen.get_height()
         
         # Font initialization
-        pygame.font.init()
-        self.title_font = pygame.font.SysFont('Arial', 72)
-        self.button_font = pygame.font.SysFont('Arial', 36)
-        self.info_font = pygame.font.SysFont('Arial', 24)
+        self.title_font = get_font('Arial', 72)
+        self.button_font = get_font('Arial', 36)
+        self.info_font = get_font('Arial', 24)
         
         # Create buttons for main menu
-        button_width = 300
-        button_height = 60
-        button_spacing = 20
         start_y = self.height // 2 - 50
         
-        self.main_menu_buttons = [
-            Button(
-                self.width // 2 - button_width // 2,
-                start_y,
-                button_width,
-                button_height,
-                "Play Game",
-                self.button_font,
-                self.theme_manager,
-                "play"
-            ),
-            Button(
-                self.width // 2 - button_width // 2,
-                start_y + button_height + button_spacing,
-                button_width,
-                button_height,
-                "Options",
-                self.button_font,
-                self.theme_manager,
-                "options"
-            ),
-            Button(
-                self.width // 2 - button_width // 2,
-                start_y + (button_height + button_spacing) * 2,
-                button_width,
-                button_height,
-                "Controls",
-                self.button_font,
-                self.theme_manager,
-                "controls"
-            ),
-            Button(
-                self.width // 2 - button_width // 2,
-                start_y + (button_height + button_spacing) * 3,
-                button_width,
-                button_height,
-                "Quit",
-                self.button_font,
-                self.theme_manager,
-                "quit"
-            )
-        ]
+        self.main_menu_buttons = self._make_column([
+            ("Play Game", "play"),
+            ("Options", "options"),
+            ("Controls", "controls"),
+            ("Quit", "quit")
+        ], start_y)
         
         # Create buttons for options menu
-        self.options_menu_buttons = [
-            Button(
-                self.width // 2 - button_width // 2,
-                start_y,
-                button_width,
-                button_height,
-                "Sound: ON",
-                self.button_font,
-                self.theme_manager,
-                "toggle_sound"
-            ),
-            Button(
-                self.width // 2 - button_width // 2,
-                start_y + button_height + button_spacing,
-                button_width,
-                button_height,
-                "Music: ON",
-                self.button_font,
-                self.theme_manager,
-                "toggle_music"
-            ),
-            Button(
-                self.width // 2 - button_width // 2,
-                start_y + (button_height + button_spacing) * 2,
-                button_width,
-                button_height,
-                "Theme: Neon",
-                self.button_font,
-                self.theme_manager,
-                "cycle_theme"
-            ),
-            Button(
-                self.width // 2 - button_width // 2,
-                start_y + (button_height + button_spacing) * 3,
-                button_width,
-                button_height,
-                "Back",
-                self.button_font,
-                self.theme_manager,
-                "back"
-            )
-        ]
+        self.options_menu_buttons = self._make_column([
+            ("Sound: ON", "toggle_sound"),
+            ("Music: ON", "toggle_music"),
+            ("Theme: Neon", "cycle_theme"),
+            ("Back", "back")
+        ], start_y)
         
         # Create back button for controls screen
-        self.controls_menu_buttons = [
-            Button(
-                self.width // 2 - button_width // 2,
-                self.height - 100,
-                button_width,
-                button_height,
-                "Back",
-                self.button_font,
-                self.theme_manager,
-                "back"
-            )
-        ]
+        self.controls_menu_buttons = self._make_column([("Back", "back")], self.height - 100)
         
         # Menu state
         self.current_menu = "main"  # "main", "options", "controls"
         self.sound_enabled = True
         self.music_enabled = True
+        
+        # The menu is static between interactions, so it is only redrawn
+        # when something changed; a hover change only repaints its button
+        self._dirty = True
+        self._dirty_buttons = []
+        
+        # Titles, control lines and version text never change, so they are
+        # rendered once per theme instead of every frame
+        self._static_theme_name = None
+        self._build_static_surfaces()
+        
+        # Button labels only change when a setting is toggled
+        self.update_button_text()
+        
+        # Handlers for button actions; a handler returns "play" or "quit" to
+        # leave the menu, or None to stay in it
+        self._action_table = {
+            "play": lambda: "play",
+            "quit": lambda: "quit",
+            "options": lambda: self._open_menu("options"),
+            "controls": lambda: self._open_menu("controls"),
+            "back": lambda: self._open_menu("main"),
+            "toggle_sound": self._toggle_sound,
+            "toggle_music": self._toggle_music,
+            "cycle_theme": self._cycle_theme
+        }
+    
+    def _make_column(self, items, start_y, button_width=300, button_height=60, button_spacing=20):
+        """
+        Create a centered column of buttons
+        items is a list of (label, action) pairs, laid out top to bottom from start_y
+        """
+        x = (self.width - button_width) // 2
+        step = button_height + button_spacing
+        return [
+            Button(x, start_y + i * step, button_width, button_height, label,
+                   self.button_font, self.theme_manager, action)
+            for i, (label, action) in enumerate(items)
+        ]
+    
+    def _build_static_surfaces(self):
+        """Render the static menu text for the current theme"""
+        text_color = self.theme_manager.current_theme['text_color']
+        
+        # Titles with their centered positions
+        self._title_surfs = {}
+        self._title_rects = {}
+        for menu, title, y in (("main", "NEON TETRIS", 150), ("options", "OPTIONS", 150),
+                               ("controls", "CONTROLS", 100)):
+            surf, _ = self.title_font.render(title, text_color)
+            self._title_surfs[menu] = surf
+            self._title_rects[menu] = surf.get_rect(center=(self.width // 2, y))
+        
+        # Controls information
+        controls = [
+            "Arrow Left/Right: Move piece",
+            "Arrow Up: Rotate piece",
+            "Arrow Down: Soft drop",
+            "Space: Hard drop",
+            "A: Toggle AI helper",
+            "G: Toggle ghost piece",
+            "T: Change theme",
+            "P: Pause game",
+            "R: Restart game (when game over)",
+            "Q: Quit game (when game over)"
+        ]
+        
+        start_y = 200
+        self._control_surfs = [self.info_font.render(control, text_color)[0] for control in controls]
+        self._control_rects = [
+            surf.get_rect(center=(self.width // 2, start_y + i * 40))
+            for i, surf in enumerate(self._control_surfs)
+        ]
+        self._control_blits = list(zip(self._control_surfs, self._control_rects))
+        
+        # Version info
+        self._version_surf, _ = self.info_font.render("v1.0", text_color)
+        self._version_rect = self._version_surf.get_rect(topleft=(self.width - 60, self.height - 30))
+        
+        self._static_theme_name = self.theme_manager.current_theme_name
+    
+    def _check_theme(self):
+        """Re-render the static menu text if the theme changed since it was built"""
+        if self._static_theme_name != self.theme_manager.current_theme_name:
+            self._build_static_surfaces()
+    
+    def _draw_buttons(self, buttons):
+        """Draw a list of buttons with a single blits call"""
+        self.screen.blits(
+            [item for button in buttons for item in button.blit_sequence()],
+            doreturn=False
+        )
     
     def update_button_text(self):
         """Update button text based on current settings"""
@@ -204,17 +254,14 @@ class Menu:
         self.screen.fill(theme['background_color'])
         
         # Draw title
-        title_text = self.title_font.render("NEON TETRIS", True, theme['text_color'])
-        title_rect = title_text.get_rect(center=(self.width // 2, 150))
-        self.screen.blit(title_text, title_rect)
+        self._check_theme()
+        self.screen.blit(self._title_surfs["main"], self._title_rects["main"])
         
         # Draw buttons
-        for button in self.main_menu_buttons:
-            button.draw(self.screen)
+        self._draw_buttons(self.main_menu_buttons)
         
         # Draw version info
-        version_text = self.info_font.render("v1.0", True, theme['text_color'])
-        self.screen.blit(version_text, (self.width - 60, self.height - 30))
+        self.screen.blit(self._version_surf, self._version_rect)
     
     def draw_options_menu(self):
         """Draw the options menu"""
@@ -224,16 +271,11 @@ class Menu:
         self.screen.fill(theme['background_color'])
         
         # Draw title
-        title_text = self.title_font.render("OPTIONS", True, theme['text_color'])
-        title_rect = title_text.get_rect(center=(self.width // 2, 150))
-        self.screen.blit(title_text, title_rect)
-        
-        # Update button text based on current settings
-        self.update_button_text()
+        self._check_theme()
+        self.screen.blit(self._title_surfs["options"], self._title_rects["options"])
         
         # Draw buttons
-        for button in self.options_menu_buttons:
-            button.draw(self.screen)
+        self._draw_buttons(self.options_menu_buttons)
     
     def draw_controls_menu(self):
         """Draw the controls menu"""
@@ -243,33 +285,14 @@ class Menu:
         self.screen.fill(theme['background_color'])
         
         # Draw title
-        title_text = self.title_font.render("CONTROLS", True, theme['text_color'])
-        title_rect = title_text.get_rect(center=(self.width // 2, 100))
-        self.screen.blit(title_text, title_rect)
+        self._check_theme()
+        self.screen.blit(self._title_surfs["controls"], self._title_rects["controls"])
         
         # Draw controls information
-        controls = [
-            "Arrow Left/Right: Move piece",
-            "Arrow Up: Rotate piece",
-            "Arrow Down: Soft drop",
-            "Space: Hard drop",
-            "A: Toggle AI helper",
-            "G: Toggle ghost piece",
-            "T: Change theme",
-            "P: Pause game",
-            "R: Restart game (when game over)",
-            "Q: Quit game (when game over)"
-        ]
-        
-        start_y = 200
-        for i, control in enumerate(controls):
-            control_text = self.info_font.render(control, True, theme['text_color'])
-            control_rect = control_text.get_rect(center=(self.width // 2, start_y + i * 40))
-            self.screen.blit(control_text, control_rect)
+        self.screen.blits(self._control_blits, doreturn=False)
         
         # Draw back button
-        for button in self.controls_menu_buttons:
-            button.draw(self.screen)
+        self._draw_buttons(self.controls_menu_buttons)
     
     def draw(self):
         """Draw the current menu"""
@@ -280,26 +303,74 @@ class Menu:
         elif self.current_menu == "controls":
             self.draw_controls_menu()
     
-    def handle_events(self):
-        """Handle menu events"""
-        mouse_pos = pygame.mouse.get_pos()
-        
-        # Update button hover states
+    def _open_menu(self, menu):
+        """Switch to another menu screen"""
+        self.current_menu = menu
+    
+    def _toggle_sound(self):
+        """Toggle sound effects"""
+        self.sound_enabled = not self.sound_enabled
+        # Update sound settings in theme manager
+        # (This would need to be implemented in ThemeManager)
+        self.update_button_text()
+    
+    def _toggle_music(self):
+        """Toggle the background music"""
+        self.music_enabled = not self.music_enabled
+        self.theme_manager.toggle_music()
+        self.update_button_text()
+    
+    def _cycle_theme(self):
+        """Switch to the next theme and its music"""
+        self.theme_manager.cycle_theme()
+        self.theme_manager.load_music()
+        self.update_button_text()
+    
+    def _current_buttons(self):
+        """Get the buttons of the current menu"""
         if self.current_menu == "main":
-            buttons = self.main_menu_buttons
+            return self.main_menu_buttons
         elif self.current_menu == "options":
-            buttons = self.options_menu_buttons
+            return self.options_menu_buttons
         elif self.current_menu == "controls":
-            buttons = self.controls_menu_buttons
-        
+            return self.controls_menu_buttons
+    
+    def _update_hover(self, buttons, mouse_pos):
+        """Update button hover states, queueing the buttons that changed for a repaint"""
         for button in buttons:
             button.update(mouse_pos)
+            if button.hovered != button.was_hovered:
+                self._dirty_buttons.append(button)
+    
+    def handle_events(self):
+        """Handle menu events"""
+        menu = self.current_menu
+        buttons = self._current_buttons()
+        
+        # Only fetch the events the menu reacts to and drop the rest, so the
+        # queue cannot fill up while a menu is open nor hand stale events to
+        # the game; the queue was just pumped, so clearing must not pump it
+        # again or events arriving in between would be dropped unseen
+        events = pygame.event.get([
+            pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN,
+            pygame.MOUSEMOTION, pygame.VIDEOEXPOSE
+        ])
+        pygame.event.clear(pump=False)
         
         # Handle events
-        for event in pygame.event.get():
+        for event in events:
             if event.type == pygame.QUIT:
                 return "quit"
             
+            # Hover states only change when the mouse moves
+            if event.type == pygame.MOUSEMOTION:
+                self._update_hover(buttons, event.pos)
+            
+            # Clicks and key presses may change the menu, and an uncovered
+            # window needs repainting
+            if event.type in (pygame.MOUSEBUTTONDOWN, pygame.KEYDOWN, pygame.VIDEOEXPOSE):
+                self._dirty = True
+            
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     if self.current_menu == "main":
@@ -308,29 +379,17 @@ class Menu:
                         self.current_menu = "main"
             
             # Handle button clicks
-            for button in buttons:
-                action = button.handle_event(event)
-                if action:
-                    if action == "play":
-                        return "play"
-                    elif action == "options":
-                        self.current_menu = "options"
-                    elif action == "controls":
-                        self.current_menu = "controls"
-                    elif action == "back":
-                        self.current_menu = "main"
-                    elif action == "quit":
-                        return "quit"
-                    elif action == "toggle_sound":
-                        self.sound_enabled = not self.sound_enabled
-                        # Update sound settings in theme manager
-                        # (This would need to be implemented in ThemeManager)
-                    elif action == "toggle_music":
-                        self.music_enabled = not self.music_enabled
-                        self.theme_manager.toggle_music()
-                    elif action == "cycle_theme":
-                        self.theme_manager.cycle_theme()
-                        self.theme_manager.load_music()
+            if event.type == pygame.MOUSEBUTTONDOWN:
+                for button in buttons:
+                    action = button.handle_event(event)
+                    if action:
+                        result = self._action_table[action]()
+                        if result:
+                            return result
+        
+        # Buttons of a newly opened menu start from where the mouse already is
+        if self.current_menu != menu:
+            self._update_hover(self._current_buttons(), pygame.mouse.get_pos())
         
         return None  # No action to exit the menu
     
@@ -338,11 +397,31 @@ class Menu:
         """Run the menu loop"""
         clock = pygame.time.Clock()
         
+        # The game blocks mouse motion events, which the menu needs for hovering
+        pygame.event.set_allowed(pygame.MOUSEMOTION)
+        self._update_hover(self._current_buttons(), pygame.mouse.get_pos())
+        
+        # The theme may have been changed in the game since the labels were set
+        self.update_button_text()
+        
+        # The screen holds whatever was shown before the menu
+        self._dirty = True
+        
         while True:
             action = self.handle_events()
             if action in ["play", "quit"]:
+                # Mouse motion is only needed while a menu is up
+                pygame.event.set_blocked(pygame.MOUSEMOTION)
                 return action
             
-            self.draw()
-            pygame.display.flip()
+            # The clock still caps the loop while nothing is redrawn
+            if self._dirty:
+                self.draw()
+                pygame.display.flip()
+            elif self._dirty_buttons:
+                # Only the buttons whose hover state changed are repainted
+                self._draw_buttons(self._dirty_buttons)
+                pygame.display.update([button.rect for button in self._dirty_buttons])
+            self._dirty = False
+            self._dirty_buttons = []
             clock.tick(60)
@@ -3,18 +3,53 @@ Performance Tracker for Neon Tetris
 Monitors player performance and adjusts difficulty
 """
 import time
+from collections import deque
+import numpy as np
+
+def compute_difficulty(spm, lpm, accuracy):
+    """
+    Combine the performance metrics into a difficulty factor
+    Higher score/lines per minute and higher accuracy = higher difficulty
+    Returns a factor between 0.5 and 2.0
+    """
+    # Base adjustment from score per minute (normalize to expected range)
+    score_factor = min(1.5, max(0.5, spm / 1000))
+    
+    # Adjustment from lines per minute
+    lines_factor = min(1.5, max(0.5, lpm / 5))
+    
+    # Adjustment from AI recommendation accuracy
+    # If player follows AI a lot, make it harder
+    accuracy_factor = 1.0 + (accuracy - 0.5)
+    
+    # Combine factors with weights
+    factor = (
+        0.5 * score_factor +
+        0.3 * lines_factor +
+        0.2 * accuracy_factor
+    )
+    
+    # Ensure difficulty stays in reasonable range
+    return min(2.0, max(0.5, factor))
 
 class PerformanceTracker:
+    # Longest history kept for each metric, so long sessions use bounded memory
+    HISTORY_LENGTH = 4096
+    
+    # Number of recent moves considered for the AI accuracy
+    ACCURACY_WINDOW = 20
+    
     def __init__(self):
         """Initialize the Performance Tracker"""
-        # Performance metrics
-        self.score_history = []
-        self.lines_history = []
-        self.move_history = []
-        self.time_history = []
+        # Performance metrics; the rates only need the latest score and lines,
+        # so no score history is kept (None until the first record)
+        self._latest_score = None
+        self._latest_lines = None
+        self.move_history = deque(maxlen=self.HISTORY_LENGTH)
+        self.time_history = deque(maxlen=self.HISTORY_LENGTH)
         
         # Timing
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
         self.last_check_time = self.start_time
         
         # Difficulty adjustment
@@ -23,81 +58,84 @@ class PerformanceTracker:
         self.difficulty_factor = 1.0 # Current difficulty multiplier
         
         # AI recommendation tracking
-        self.ai_recommendations = []  # List of (recommended_x, recommended_rotation)
-        self.player_moves = []        # List of (actual_x, actual_rotation)
+        # Ring buffers of the most recent (x, rotation) moves, to be responsive
+        # to recent play style; row i of both arrays belongs to the same move
+        self._ai_moves = np.zeros((self.ACCURACY_WINDOW, 2), dtype=np.int16)
+        self._player_moves = np.zeros((self.ACCURACY_WINDOW, 2), dtype=np.int16)
+        self._move_head = 0   # Row written by the next recorded move
+        self._move_count = 0  # Number of filled rows
     
     def record_score(self, score, lines_cleared):
         """Record the current score and lines cleared"""
-        current_time = time.time()
-        self.score_history.append((current_time, score))
-        self.lines_history.append((current_time, lines_cleared))
+        self._latest_score = score
+        self._latest_lines = lines_cleared
     
     def record_move(self, piece_x, piece_rotation, ai_recommended_x=None, ai_recommended_rotation=None):
         """Record a move made by the player and the AI recommendation if available"""
-        current_time = time.time()
+        current_time = time.monotonic()
         self.move_history.append((current_time, piece_x, piece_rotation))
         
         if ai_recommended_x is not None and ai_recommended_rotation is not None:
-            self.ai_recommendations.append((current_time, ai_recommended_x, ai_recommended_rotation))
-            self.player_moves.append((current_time, piece_x, piece_rotation))
+            head = self._move_head
+            self._ai_moves[head] = (ai_recommended_x, ai_recommended_rotation)
+            self._player_moves[head] = (piece_x, piece_rotation)
+            self._move_head = (head + 1) % self.ACCURACY_WINDOW
+            self._move_count = min(self._move_count + 1, self.ACCURACY_WINDOW)
     
-    def get_score_per_minute(self):
-        """Calculate the average score per minute"""
-        if not self.score_history:
+    def get_score_per_minute(self, now=None):
+        """
+        Calculate the average score per minute
+        now is the current monotonic time, read from the clock if not given
+        """
+        if self._latest_score is None:
             return 0
         
-        elapsed_minutes = (time.time() - self.start_time) / 60
+        if now is None:
+            now = time.monotonic()
+        
+        elapsed_minutes = (now - self.start_time) / 60
         if elapsed_minutes < 0.1:  # Avoid division by very small numbers
             return 0
-            
-        latest_score = self.score_history[-1][1]
-        return latest_score / elapsed_minutes
+        
+        return self._latest_score / elapsed_minutes
     
-    def get_lines_per_minute(self):
-        """Calculate the average lines cleared per minute"""
-        if not self.lines_history:
+    def get_lines_per_minute(self, now=None):
+        """
+        Calculate the average lines cleared per minute
+        now is the current monotonic time, read from the clock if not given
+        """
+        if self._latest_lines is None:
             return 0
-            
-        elapsed_minutes = (time.time() - self.start_time) / 60
+        
+        if now is None:
+            now = time.monotonic()
+        
+        elapsed_minutes = (now - self.start_time) / 60
         if elapsed_minutes < 0.1:  # Avoid division by very small numbers
             return 0
-            
-        latest_lines = self.lines_history[-1][1]
-        return latest_lines / elapsed_minutes
+        
+        return self._latest_lines / elapsed_minutes
     
     def calculate_move_accuracy(self):
         """
         Calculate how closely the player follows AI recommendations
         Returns a value between 0 (never follows) and 1 (always follows)
         """
-        if not self.ai_recommendations or not self.player_moves:
+        count = self._move_count
+        if not count:
             return 0.5  # Default middle value when no data
         
-        # Only consider the last 20 moves to be responsive to recent play style
-        ai_recent = self.ai_recommendations[-20:] if len(self.ai_recommendations) > 20 else self.ai_recommendations
-        player_recent = self.player_moves[-20:] if len(self.player_moves) > 20 else self.player_moves
-        
-        if len(ai_recent) != len(player_recent):
-            return 0.5  # Should be equal, but just in case
-        
-        # Calculate match percentage
-        matches = 0
-        for i in range(len(ai_recent)):
-            ai_time, ai_x, ai_rot = ai_recent[i]
-            player_time, player_x, player_rot = player_recent[i]
-            
-            # Consider a match if both position and rotation are the same
-            if ai_x == player_x and ai_rot == player_rot:
-                matches += 1
-        
-        return matches / len(ai_recent) if ai_recent else 0.5
+        # Consider a match if both position and rotation are the same; the
+        # order of the rows does not matter for the match percentage
+        matches = np.all(self._ai_moves[:count] == self._player_moves[:count], axis=1)
+        return float(matches.mean())
     
     def adjust_difficulty(self):
         """
         Adjust difficulty based on player performance
         Returns the new drop speed in milliseconds
         """
-        current_time = time.time()
+        current_time = time.monotonic()
         
         # Only adjust every 30 seconds
         if current_time - self.last_check_time < 30:
@@ -106,32 +144,13 @@ class PerformanceTracker:
         self.last_check_time = current_time
         
         # Get performance metrics
-        spm = self.get_score_per_minute()
-        lpm = self.get_lines_per_minute()
+        # One clock reading serves every metric
+        spm = self.get_score_per_minute(current_time)
+        lpm = self.get_lines_per_minute(current_time)
         accuracy = self.calculate_move_accuracy()
         
         # Adjust difficulty factor based on performance
-        # Higher score/lines per minute and higher accuracy = higher difficulty
-        
-        # Base adjustment from score per minute (normalize to expected range)
-        score_factor = min(1.5, max(0.5, spm / 1000))
-        
-        # Adjustment from lines per minute
-        lines_factor = min(1.5, max(0.5, lpm / 5))
-        
-        # Adjustment from AI recommendation accuracy
-        # If player follows AI a lot, make it harder
-        accuracy_factor = 1.0 + (accuracy - 0.5)
-        
-        # Combine factors with weights
-        self.difficulty_factor = (
-            0.5 * score_factor +
-            0.3 * lines_factor +
-            0.2 * accuracy_factor
-        )
-        
-        # Ensure difficulty stays in reasonable range
-        self.difficulty_factor = min(2.0, max(0.5, self.difficulty_factor))
+        self.difficulty_factor = compute_difficulty(spm, lpm, accuracy)
         
         return self.get_current_drop_speed()
     
@@ -144,5 +163,19 @@ class PerformanceTracker:
         return max(self.min_drop_speed, int(speed))
     
     def reset(self):
-        """Reset the performance tracker"""
-        self.__init__()
+        """Reset the performance tracker, reusing its existing buffers"""
+        self._latest_score = None
+        self._latest_lines = None
+        self.move_history.clear()
+        self.time_history.clear()
+        
+        now = time.monotonic()
+        self.start_time = now
+        self.last_check_time = now
+        
+        self.difficulty_factor = 1.0
+        
+        # Emptying the ring buffers only needs their bookkeeping reset; rows
+        # are always written before they are read again
+        self._move_head = 0
+        self._move_count = 0
@@ -3,19 +3,65 @@ Renderer module for Neon Tetris
 Handles all drawing operations
 """
 import pygame
+import numpy as np
+from src.tetromino import Tetromino
+
+# Fonts keyed by size; SysFont searches the system fonts, so each size is
+# only created once however often the window is resized
+_FONT_CACHE = {}
+
+def _get_font(size):
+    """Get the Arial system font at size, creating it on first use"""
+    font = _FONT_CACHE.get(size)
+    if font is None:
+        font = pygame.font.SysFont('Arial', size)
+        _FONT_CACHE[size] = font
+    return font
 
 class Renderer:
     def __init__(self, screen, theme_manager):
-        """Initialize the renderer"""
+        """
+        Initialize the renderer
+        Every cached surface is converted to the display pixel format when it
+        is built, so the display mode must be set before the renderer is made
+        """
         self.screen = screen
         self.theme_manager = theme_manager
         self.width = screen.get_width()
         self.height = screen.get_height()
         
-        # Font initialization
-        pygame.font.init()
+        # Screen areas that changed this frame and last frame, see present
+        self._dirty_rects = []
+        self._last_dirty_rects = []
+        self._full_redraw = True
+        self._overlay_drawn = False
+        self._last_overlay_drawn = False
+        self._present_theme_name = None
+        
+        # Rendered text, see _render_text and _render_value
+        self._text_cache = {}
+        self._value_cache = {}
+        self._panel_cache = {}
+        
+        # Font initialization, skipped when pygame.init already did it
+        if not pygame.font.get_init():
+            pygame.font.init()
         self.update_fonts()
         
+        # Cached board rendering, see draw_board
+        self._board_surface = None
+        self._board_cache_key = None
+        
+        # Cached empty grid the board is rendered on, see _get_grid_surface
+        self._grid_surface = None
+        self._grid_cache_key = None
+        
+        # Block surfaces with their border baked in, see _get_block_surface
+        self._block_surfs = {}
+        self._ghost_surfs = {}
+        self._suggestion_surf = None
+        self._block_cache_key = None
+        
         # Board dimensions and position
         self.update_layout()
     
@@ -26,6 +72,43 @@ class Renderer:
         self.height = screen.get_height()
         self.update_layout()
         self.update_fonts()
+        self._full_redraw = True
+    
+    def invalidate(self):
+        """Make the next present() update the whole screen"""
+        self._full_redraw = True
+    
+    def _mark_dirty(self, rect):
+        """Record a screen area drawn this frame that may differ from the last one"""
+        self._dirty_rects.append(rect)
+    
+    def present(self):
+        """
+        Show the frame on the display
+        Only the areas that changed this frame or last frame (which may need
+        erasing) are updated, unless they cover most of the screen or the
+        whole screen changed (overlays, theme or layout changes)
+        """
+        rects = self._dirty_rects + self._last_dirty_rects
+        theme_name = self.theme_manager.current_theme_name
+        full = (
+            self._full_redraw or
+            self._overlay_drawn or self._last_overlay_drawn or
+            theme_name != self._present_theme_name or
+            sum(rect.width * rect.height for rect in rects) > self.width * self.height // 2
+        )
+        
+        if full:
+            pygame.display.flip()
+        else:
+            pygame.display.update(rects)
+        
+        self._last_dirty_rects = self._dirty_rects
+        self._dirty_rects = []
+        self._last_overlay_drawn = self._overlay_drawn
+        self._overlay_drawn = False
+        self._full_redraw = False
+        self._present_theme_name = theme_name
     
     def update_layout(self):
         """Update layout based on screen size"""
@@ -37,13 +120,101 @@ class Renderer:
         # Center the board horizontally
         self.board_x = max(50, (self.width - (10 * self.cell_size)) // 2 - 100)
         self.board_y = max(20, (self.height - (20 * self.cell_size)) // 2)
+        
+        # Next piece preview box, right of the board (fixed board width of 10)
+        cell_size = self.cell_size
+        preview_x = self.board_x + (10 * cell_size) + 20
+        preview_y = self.board_y + 2 * cell_size
+        
+        # Size the box for the largest first rotation of any shape
+        shapes = [rotations[0] for rotations in Tetromino.SHAPES.values()]
+        preview_width = max(6, max(len(shape[0]) for shape in shapes) + 2) * cell_size // 2
+        preview_height = max(6, max(len(shape) for shape in shapes) + 2) * cell_size // 2
+        self.preview_rect = pygame.Rect(preview_x, preview_y, preview_width, preview_height)
+        self.preview_label_pos = (preview_x + 10, preview_y - 30)
+        
+        # Screen position of the half size sprite of every shape, centered in the box
+        self.preview_piece_pos = {
+            name: (
+                preview_x + preview_width // 2 - (len(rotations[0][0]) * cell_size // 2) // 2,
+                preview_y + preview_height // 2 - (len(rotations[0]) * cell_size // 2) // 2
+            )
+            for name, rotations in Tetromino.SHAPES.items()
+        }
+        
+        # Score box below the preview, with a label and a value on each row
+        score_x = self.board_x + (10 * cell_size) + 20
+        score_y = self.board_y + 12 * cell_size // 2
+        self.score_rect = pygame.Rect(score_x, score_y, max(200, self.width // 5), 150)
+        padding = 10
+        self.text_positions = {}
+        for row, slot in enumerate(('score', 'level', 'lines')):
+            text_y = score_y + padding + row * 50
+            self.text_positions[slot + '_label'] = (score_x + padding, text_y)
+            self.text_positions[slot + '_value'] = (score_x + padding + 100, text_y)
+        
+        # Full screen overlays of the pause and game over screens, only
+        # rebuilt when the screen size changes
+        self._pause_overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA).convert_alpha()
+        self._pause_overlay.fill((0, 0, 0, 150))
+        self._gameover_overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA).convert_alpha()
+        self._gameover_overlay.fill((0, 0, 0, 180))
     
     def update_fonts(self):
         """Update font sizes based on screen size"""
         base_size = max(10, min(36, self.height // 20))
-        self.font_lg = pygame.font.SysFont('Arial', base_size * 2)
-        self.font_md = pygame.font.SysFont('Arial', base_size)
-        self.font_sm = pygame.font.SysFont('Arial', int(base_size * 0.75))
+        self.font_lg = _get_font(base_size * 2)
+        self.font_md = _get_font(base_size)
+        self.font_sm = _get_font(int(base_size * 0.75))
+        
+        # Text rendered with the old fonts is out of date
+        self._text_cache.clear()
+        self._value_cache.clear()
+        self._panel_cache.clear()
+    
+    def _render_text(self, text, font, color):
+        """
+        Render text that comes from a small fixed set of strings (labels,
+        help lines), keeping every rendering for reuse
+        """
+        key = (text, font, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            surface = self._text_cache[key] = font.render(text, True, color).convert_alpha()
+        return surface
+    
+    def _render_value(self, slot, text, font, color):
+        """
+        Render text that changes during play (score, level, ...), keeping only
+        the latest rendering for each slot so it is reused until the text changes
+        """
+        key = (text, font, color)
+        cached = self._value_cache.get(slot)
+        if cached is None or cached[0] != key:
+            cached = self._value_cache[slot] = (key, font.render(text, True, color).convert_alpha())
+        return cached[1]
+    
+    def _render_panel(self, slot, lines, font, color, line_height, centered=False):
+        """
+        Render a static block of text lines into one transparent surface, so
+        the block is drawn with a single blit; it is kept for each slot until
+        the font or color changes
+        """
+        key = (lines, font, color)
+        cached = self._panel_cache.get(slot)
+        if cached is None or cached[0] != key:
+            texts = [self._render_text(line, font, color) for line in lines]
+            width = max(text.get_width() for text in texts)
+            height = (len(texts) - 1) * line_height + texts[-1].get_height()
+            panel = pygame.Surface((width, height), pygame.SRCALPHA).convert_alpha()
+            
+            # The panel starts fully transparent, so taking the maximum of each
+            # channel copies the text pixels exactly, alpha included
+            for i, text in enumerate(texts):
+                x = width // 2 - text.get_width() // 2 if centered else 0
+                panel.blit(text, (x, i * line_height), special_flags=pygame.BLEND_RGBA_MAX)
+            cached = self._panel_cache[slot] = (key, panel)
+        return cached[1]
     
     def draw_background(self):
         """Draw the game background"""
@@ -53,218 +224,233 @@ class Renderer:
     
     def draw_board(self, board):
         """Draw the game board"""
+        # The board only changes when a piece locks or lines clear, so it is
+        # rendered once to a surface and redrawn only when it is out of date
+        cache_key = (board, board.version, self.theme_manager.current_theme_name, self.cell_size)
+        if cache_key != self._board_cache_key:
+            self._render_board(board)
+            self._board_cache_key = cache_key
+            self._mark_dirty(self._board_surface.get_rect(topleft=(self.board_x, self.board_y)))
+        
+        self.screen.blit(self._board_surface, (self.board_x, self.board_y))
+    
+    def _get_grid_surface(self, board):
+        """
+        Get the empty grid for the board, drawn on the background color
+        The grid only depends on the theme and the layout, so it is drawn once
+        and reused until either changes
+        """
+        grid_cache_key = (board.width, board.height, self.theme_manager.current_theme_name, self.cell_size)
+        if grid_cache_key != self._grid_cache_key:
+            theme = self.theme_manager.current_theme
+            cell_size = self.cell_size
+            surface = pygame.Surface((board.width * cell_size, board.height * cell_size)).convert()
+            surface.fill(theme['background_color'])
+            
+            # Draw the empty grid; the loop only touches locals
+            grid_color = theme['grid_color']
+            draw_rect = pygame.draw.rect
+            for y in range(board.height):
+                pos_y = y * cell_size
+                for x in range(board.width):
+                    draw_rect(surface, grid_color, (x * cell_size, pos_y, cell_size - 1, cell_size - 1), 1)
+            
+            self._grid_surface = surface
+            self._grid_cache_key = grid_cache_key
+        
+        return self._grid_surface
+    
+    def _check_block_cache(self):
+        """Drop the cached block surfaces if the theme or cell size changed"""
+        block_cache_key = (self.theme_manager.current_theme_name, self.cell_size)
+        if block_cache_key != self._block_cache_key:
+            self._block_surfs.clear()
+            self._ghost_surfs.clear()
+            self._suggestion_surf = None
+            self._block_cache_key = block_cache_key
+    
+    def _get_block_surface(self, color, size):
+        """
+        Get a size x size block filled with color and outlined with the theme
+        border, so each block is drawn with a single blit
+        """
+        surface = self._block_surfs.get((color, size))
+        if surface is None:
+            surface = pygame.Surface((size, size)).convert()
+            surface.fill(color)
+            pygame.draw.rect(surface, self.theme_manager.current_theme['border_color'], (0, 0, size, size), 1)
+            self._block_surfs[(color, size)] = surface
+        return surface
+    
+    def _get_ghost_surface(self, ghost_color):
+        """Get a ghost block filled with an (r, g, b, alpha) color and an opaque theme border"""
+        surface = self._ghost_surfs.get(ghost_color)
+        if surface is None:
+            theme = self.theme_manager.current_theme
+            size = self.cell_size - 1
+            surface = pygame.Surface((size, size), pygame.SRCALPHA).convert_alpha()
+            surface.fill(ghost_color)
+            pygame.draw.rect(surface, theme['border_color'], (0, 0, size, size), 1)
+            self._ghost_surfs[ghost_color] = surface
+        return surface
+    
+    def _get_suggestion_surface(self):
+        """Get the transparent cell with a white outline that marks the AI suggestion"""
+        if self._suggestion_surf is None:
+            size = self.cell_size - 1
+            surface = pygame.Surface((size, size), pygame.SRCALPHA).convert_alpha()
+            pygame.draw.rect(surface, (255, 255, 255), (0, 0, size, size), 2)
+            self._suggestion_surf = surface
+        return self._suggestion_surf
+    
+    def _render_board(self, board):
+        """Render the grid, the placed cells and the outline to the board surface"""
         theme = self.theme_manager.current_theme
+        size = (board.width * self.cell_size, board.height * self.cell_size)
+        if self._board_surface is None or self._board_surface.get_size() != size:
+            self._board_surface = pygame.Surface(size).convert()
+        
+        # Start from the empty grid
+        surface = self._board_surface
+        surface.blit(self._get_grid_surface(board), (0, 0))
+        
+        # Draw the filled cells over it in one batch; the cell positions come
+        # straight from NumPy and only the few distinct packed 0xRRGGBB colors
+        # are decoded to block surfaces
+        self._check_block_cache()
+        cell_size = self.cell_size
+        ys, xs = np.nonzero(board.grid)
+        colors, color_index = np.unique(board.colors_packed[ys, xs], return_inverse=True)
+        blocks = [
+            self._get_block_surface(((color >> 16) & 0xFF, (color >> 8) & 0xFF, color & 0xFF), cell_size - 1)
+            for color in colors.tolist()
+        ]
+        positions = np.column_stack((xs * cell_size, ys * cell_size)).tolist()
+        surface.blits([
+            (blocks[index], position) for index, position in zip(color_index.tolist(), positions)
+        ], doreturn=False)
         
-        # Draw the grid
-        for y in range(board.height):
-            for x in range(board.width):
-                # Calculate position on screen
-                pos_x = x * self.cell_size + self.board_x
-                pos_y = y * self.cell_size + self.board_y
-                
-                # Draw the cell
-                if board.grid[y][x]:
-                    color = board.colors[y][x]
-                    pygame.draw.rect(self.screen, color, (pos_x, pos_y, self.cell_size-1, self.cell_size-1))
-                    pygame.draw.rect(self.screen, theme['border_color'], (pos_x, pos_y, self.cell_size-1, self.cell_size-1), 1)
-                else:
-                    # Draw empty cell
-                    pygame.draw.rect(self.screen, theme['grid_color'], (pos_x, pos_y, self.cell_size-1, self.cell_size-1), 1)
-        
-        # Draw board outline
-        board_rect = pygame.Rect(
-            self.board_x, 
-            self.board_y, 
-            board.width * self.cell_size, 
-            board.height * self.cell_size
-        )
-        pygame.draw.rect(self.screen, theme['border_color'], board_rect, 2)
+        # Draw board outline; it overlaps the edge cells, so it goes on last
+        pygame.draw.rect(surface, theme['border_color'], surface.get_rect(), 2)
     
     def draw_piece(self, piece):
         """Draw a tetromino piece"""
-        theme = self.theme_manager.current_theme
-        shape = piece.get_current_rotation()
-        
-        for y, row in enumerate(shape):
-            for x, cell in enumerate(row):
-                if cell:
-                    # Calculate position on screen
-                    pos_x = (piece.x + x) * self.cell_size + self.board_x
-                    pos_y = (piece.y + y) * self.cell_size + self.board_y
-                    
-                    # Draw the block
-                    pygame.draw.rect(self.screen, piece.color, (pos_x, pos_y, self.cell_size-1, self.cell_size-1))
-                    pygame.draw.rect(self.screen, theme['border_color'], (pos_x, pos_y, self.cell_size-1, self.cell_size-1), 1)
+        # The whole piece is one pre-rendered sprite
+        sprite = self.theme_manager.piece_sprites.get(piece, self.cell_size)
+        pos_x = piece.x * self.cell_size + self.board_x
+        pos_y = piece.y * self.cell_size + self.board_y
+        self._mark_dirty(self.screen.blit(sprite, (pos_x, pos_y)))
     
-    def draw_ghost_piece(self, ghost_piece):
-        """Draw a ghost piece (semi-transparent)"""
-        theme = self.theme_manager.current_theme
-        shape = ghost_piece.get_current_rotation()
-        
-        # Create a surface for the ghost piece with alpha
-        ghost_surface = pygame.Surface((self.cell_size-1, self.cell_size-1), pygame.SRCALPHA)
-        r, g, b = ghost_piece.color
-        ghost_color = (r, g, b, theme['ghost_alpha'])
-        
-        for y, row in enumerate(shape):
-            for x, cell in enumerate(row):
-                if cell:
-                    # Calculate position on screen
-                    pos_x = (ghost_piece.x + x) * self.cell_size + self.board_x
-                    pos_y = (ghost_piece.y + y) * self.cell_size + self.board_y
-                    
-                    # Draw the ghost block
-                    ghost_surface.fill(ghost_color)
-                    self.screen.blit(ghost_surface, (pos_x, pos_y))
-                    pygame.draw.rect(self.screen, theme['border_color'], (pos_x, pos_y, self.cell_size-1, self.cell_size-1), 1)
+    def draw_ghost_piece(self, piece, ghost_y):
+        """Draw a semi-transparent copy of the piece at row ghost_y"""
+        self._check_block_cache()
+        cell_size = self.cell_size
+        block = self._get_ghost_surface(self.theme_manager.current_theme['ghost_colors'][piece.shape_name])
+        
+        # Draw every ghost block of the piece in one batch
+        origin_x = piece.x * cell_size + self.board_x
+        origin_y = ghost_y * cell_size + self.board_y
+        rects = self.screen.blits([
+            (block, (origin_x + x * cell_size, origin_y + y * cell_size))
+            for x, y in piece.meta()['cells']
+        ])
+        self._mark_dirty(rects[0].unionall(rects[1:]))
     
     def draw_ai_suggestion(self, suggested_piece):
         """Draw the AI's suggested piece position"""
-        theme = self.theme_manager.current_theme
-        shape = suggested_piece.get_current_rotation()
-        
-        # Create a surface for the suggested piece with highlight
-        for y, row in enumerate(shape):
-            for x, cell in enumerate(row):
-                if cell:
-                    # Calculate position on screen
-                    pos_x = (suggested_piece.x + x) * self.cell_size + self.board_x
-                    pos_y = (suggested_piece.y + y) * self.cell_size + self.board_y
-                    
-                    # Draw a highlighted border around the suggested position
-                    pygame.draw.rect(self.screen, (255, 255, 255), 
-                                    (pos_x, pos_y, self.cell_size-1, self.cell_size-1), 2)
+        self._check_block_cache()
+        cell_size = self.cell_size
+        outline = self._get_suggestion_surface()
+        
+        # Draw a highlighted border around every suggested cell in one batch
+        origin_x = suggested_piece.x * cell_size + self.board_x
+        origin_y = suggested_piece.y * cell_size + self.board_y
+        rects = self.screen.blits([
+            (outline, (origin_x + x * cell_size, origin_y + y * cell_size))
+            for x, y in suggested_piece.meta()['cells']
+        ])
+        self._mark_dirty(rects[0].unionall(rects[1:]))
     
     def draw_next_piece(self, next_piece):
         """Draw the next piece preview"""
         theme = self.theme_manager.current_theme
-        shape = next_piece.shape[0]  # Always use first rotation for preview
-        
-        # Calculate the size of the piece
-        piece_height = len(shape)
-        piece_width = len(shape[0])
-        
-        # Calculate the position for the next piece preview
-        # Use a fixed width of 10 for the board width
-        preview_x = self.board_x + (10 * self.cell_size) + 20
-        preview_y = self.board_y + 2 * self.cell_size
-        
-        # Draw the preview box
-        preview_width = max(6, piece_width + 2) * self.cell_size // 2
-        preview_height = max(6, piece_height + 2) * self.cell_size // 2
         
         # Draw preview box background
-        pygame.draw.rect(self.screen, theme['ui_background'], 
-                        (preview_x, preview_y, preview_width, preview_height))
+        self._mark_dirty(pygame.draw.rect(self.screen, theme['ui_background'], self.preview_rect))
         
         # Draw preview box border
-        pygame.draw.rect(self.screen, theme['ui_color'], 
-                        (preview_x, preview_y, preview_width, preview_height), 2)
+        pygame.draw.rect(self.screen, theme['ui_color'], self.preview_rect, 2)
         
         # Draw "Next Piece" text
-        next_text = self.font_md.render("Next Piece", True, theme['text_color'])
-        self.screen.blit(next_text, (preview_x + 10, preview_y - 30))
-        
-        # Calculate center position for the piece
-        center_x = preview_x + preview_width // 2 - (piece_width * self.cell_size // 2) // 2
-        center_y = preview_y + preview_height // 2 - (piece_height * self.cell_size // 2) // 2
-        
-        # Draw the next piece
-        for y, row in enumerate(shape):
-            for x, cell in enumerate(row):
-                if cell:
-                    pos_x = center_x + x * self.cell_size // 2
-                    pos_y = center_y + y * self.cell_size // 2
-                    
-                    pygame.draw.rect(self.screen, next_piece.color, 
-                                    (pos_x, pos_y, self.cell_size//2-1, self.cell_size//2-1))
-                    pygame.draw.rect(self.screen, theme['border_color'], 
-                                    (pos_x, pos_y, self.cell_size//2-1, self.cell_size//2-1), 1)
+        next_text = self._render_text("Next Piece", self.font_md, theme['text_color'])
+        self.screen.blit(next_text, self.preview_label_pos)
+        
+        # Draw the next piece as a half size sprite, always in its first rotation
+        sprite = self.theme_manager.piece_sprites.get(next_piece, self.cell_size, rotation=0, half=True)
+        self.screen.blit(sprite, self.preview_piece_pos[next_piece.shape_name])
     
     def draw_score_and_level(self, score, level, lines_cleared):
         """Draw the score, level, and lines cleared"""
         theme = self.theme_manager.current_theme
         
-        # Position for the score display
-        # Use a fixed width of 10 for the board width
-        score_x = self.board_x + (10 * self.cell_size) + 20
-        score_y = self.board_y + 12 * self.cell_size // 2
-        
         # Draw score box background
-        score_width = max(200, self.width // 5)
-        score_height = 150
-        pygame.draw.rect(self.screen, theme['ui_background'], 
-                        (score_x, score_y, score_width, score_height))
+        self._mark_dirty(pygame.draw.rect(self.screen, theme['ui_background'], self.score_rect))
         
         # Draw score box border
-        pygame.draw.rect(self.screen, theme['ui_color'], 
-                        (score_x, score_y, score_width, score_height), 2)
-        
-        # Draw score text
-        score_label = self.font_md.render("Score:", True, theme['text_color'])
-        score_value = self.font_lg.render(str(score), True, theme['text_color'])
-        
-        # Draw level text
-        level_label = self.font_md.render("Level:", True, theme['text_color'])
-        level_value = self.font_lg.render(str(level), True, theme['text_color'])
-        
-        # Draw lines cleared text
-        lines_label = self.font_md.render("Lines:", True, theme['text_color'])
-        lines_value = self.font_lg.render(str(lines_cleared), True, theme['text_color'])
-        
-        # Position and draw the text
-        padding = 10
-        self.screen.blit(score_label, (score_x + padding, score_y + padding))
-        self.screen.blit(score_value, (score_x + padding + 100, score_y + padding))
-        
-        self.screen.blit(level_label, (score_x + padding, score_y + padding + 50))
-        self.screen.blit(level_value, (score_x + padding + 100, score_y + padding + 50))
-        
-        self.screen.blit(lines_label, (score_x + padding, score_y + padding + 100))
-        self.screen.blit(lines_value, (score_x + padding + 100, score_y + padding + 100))
+        pygame.draw.rect(self.screen, theme['ui_color'], self.score_rect, 2)
+        
+        # Draw the labels and the values next to them
+        text_color = theme['text_color']
+        positions = self.text_positions
+        for slot, label, value in (
+            ('score', "Score:", score),
+            ('level', "Level:", level),
+            ('lines', "Lines:", lines_cleared)
+        ):
+            label_text = self._render_text(label, self.font_md, text_color)
+            value_text = self._render_value(slot, str(value), self.font_lg, text_color)
+            self.screen.blit(label_text, positions[slot + '_label'])
+            self._mark_dirty(self.screen.blit(value_text, positions[slot + '_value']))
     
     def draw_game_over(self, final_score):
         """Draw the game over screen"""
         theme = self.theme_manager.current_theme
         
-        # Create a semi-transparent overlay
-        overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        self.screen.blit(overlay, (0, 0))
+        # Darken the screen with the semi-transparent overlay
+        self.screen.blit(self._gameover_overlay, (0, 0))
+        self._overlay_drawn = True
         
         # Draw game over text
-        game_over_text = self.font_lg.render("GAME OVER", True, theme['text_color'])
-        score_text = self.font_md.render(f"Final Score: {final_score}", True, theme['text_color'])
-        restart_text = self.font_md.render("Press R to Restart", True, theme['text_color'])
-        quit_text = self.font_md.render("Press Q to Quit", True, theme['text_color'])
-        menu_text = self.font_md.render("Press ESC for Menu", True, theme['text_color'])
+        text_color = theme['text_color']
+        game_over_text = self._render_text("GAME OVER", self.font_lg, text_color)
+        score_text = self._render_value('final_score', f"Final Score: {final_score}", self.font_md, text_color)
+        help_panel = self._render_panel(
+            'game_over_help',
+            ("Press R to Restart", "Press Q to Quit", "Press ESC for Menu"),
+            self.font_md, text_color, 40, centered=True
+        )
         
         # Center the text
         game_over_x = self.width // 2 - game_over_text.get_width() // 2
         score_x = self.width // 2 - score_text.get_width() // 2
-        restart_x = self.width // 2 - restart_text.get_width() // 2
-        quit_x = self.width // 2 - quit_text.get_width() // 2
-        menu_x = self.width // 2 - menu_text.get_width() // 2
+        help_x = self.width // 2 - help_panel.get_width() // 2
         
         # Draw the text
         self.screen.blit(game_over_text, (game_over_x, self.height // 2 - 80))
         self.screen.blit(score_text, (score_x, self.height // 2 - 20))
-        self.screen.blit(restart_text, (restart_x, self.height // 2 + 40))
-        self.screen.blit(quit_text, (quit_x, self.height // 2 + 80))
-        self.screen.blit(menu_text, (menu_x, self.height // 2 + 120))
+        self.screen.blit(help_panel, (help_x, self.height // 2 + 40))
     
     def draw_current_theme(self):
         """Draw the current theme name"""
-        theme = self.theme_manager.current_theme
-        theme_text = self.font_sm.render(f"Theme: {self.theme_manager.current_theme_name}", True, theme['text_color'])
-        self.screen.blit(theme_text, (10, self.height - 30))
+        theme_manager = self.theme_manager
+        theme_text = self._render_text(f"Theme: {theme_manager.current_theme_name}", self.font_sm, theme_manager.current_theme['text_color'])
+        self._mark_dirty(self.screen.blit(theme_text, (10, self.height - 30)))
     
     def draw_ai_helper_status(self, ai_enabled):
         """Draw the AI helper status"""
-        theme = self.theme_manager.current_theme
         status = "ON" if ai_enabled else "OFF"
-        ai_text = self.font_sm.render(f"AI Helper: {status}", True, theme['text_color'])
-        self.screen.blit(ai_text, (10, self.height - 60))
+        ai_text = self._render_text(f"AI Helper: {status}", self.font_sm, self.theme_manager.current_theme['text_color'])
+        self._mark_dirty(self.screen.blit(ai_text, (10, self.height - 60)))
     
     def draw_controls_help(self):
         """Draw the controls help text"""
@@ -275,7 +461,7 @@ class Renderer:
         controls_y = 10
         
         # Draw controls text
-        controls = [
+        controls = (
             "Controls:",
             "← → : Move",
             "↑ : Rotate",
@@ -287,24 +473,23 @@ class Renderer:
             "F : Toggle Fullscreen",
             "P : Pause Game",
             "ESC : Menu"
-        ]
+        )
         
-        for i, text in enumerate(controls):
-            control_text = self.font_sm.render(text, True, theme['text_color'])
-            self.screen.blit(control_text, (controls_x, controls_y + i * 20))
+        # The lines never change, so they are drawn as one pre-rendered panel
+        panel = self._render_panel('controls', controls, self.font_sm, theme['text_color'], 20)
+        self.screen.blit(panel, (controls_x, controls_y))
     
     def draw_pause_screen(self):
         """Draw the pause screen overlay"""
-        # Create a semi-transparent overlay
-        overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 150))
-        self.screen.blit(overlay, (0, 0))
+        # Darken the screen with the semi-transparent overlay
+        self.screen.blit(self._pause_overlay, (0, 0))
+        self._overlay_drawn = True
         
         # Draw pause text
-        theme = self.theme_manager.current_theme
-        pause_text = self.font_lg.render("PAUSED", True, theme['text_color'])
-        continue_text = self.font_md.render("Press P to Continue", True, theme['text_color'])
-        menu_text = self.font_md.render("Press ESC for Menu", True, theme['text_color'])
+        text_color = self.theme_manager.current_theme['text_color']
+        pause_text = self._render_text("PAUSED", self.font_lg, text_color)
+        continue_text = self._render_text("Press P to Continue", self.font_md, text_color)
+        menu_text = self._render_text("Press ESC for Menu", self.font_md, text_color)
         
         # Center the text
         pause_x = self.width // 2 - pause_text.get_width() // 2
@@ -3,6 +3,60 @@ Tetromino class - Represents a tetris piece
 """
 import pygame
 import random
+from collections import deque
+
+def _rotation_meta(rotation):
+    """
+    Precompute the metadata of a rotated shape
+    - cells: (dx, dy) offsets of the filled cells
+    - bounds: (min_x, max_x, min_y, max_y) of the filled cells
+    - width: effective width of the filled cells
+    - top_by_col: highest filled row offset of every occupied column
+    - bottom_by_col: lowest filled row offset of every occupied column
+    - row_masks: (dy, mask) for every filled row, bit dx of mask per cell
+    """
+    cells = tuple((x, y) for y, row in enumerate(rotation) for x, cell in enumerate(row) if cell)
+    xs = [x for x, _ in cells]
+    ys = [y for _, y in cells]
+    
+    top_by_col = {}
+    bottom_by_col = {}
+    for x, y in cells:
+        top_by_col[x] = min(y, top_by_col.get(x, y))
+        bottom_by_col[x] = max(y, bottom_by_col.get(x, y))
+    
+    row_masks = {}
+    for x, y in cells:
+        row_masks[y] = row_masks.get(y, 0) | (1 << x)
+    
+    return {
+        'cells': cells,
+        'row_masks': tuple(sorted(row_masks.items())),
+        'bounds': (min(xs), max(xs), min(ys), max(ys)),
+        'width': max(xs) - min(xs) + 1,
+        'top_by_col': dict(sorted(top_by_col.items())),
+        'bottom_by_col': dict(sorted(bottom_by_col.items()))
+    }
+
+class _BagGenerator:
+    """
+    7-bag randomizer: every shape is dealt once, in random order, before any
+    shape repeats
+    """
+    def __init__(self, keys):
+        """Initialize the bag with the shape names to deal"""
+        self.keys = list(keys)
+        self.bag = deque()
+    
+    def __iter__(self):
+        return self
+    
+    def __next__(self):
+        """Deal the next shape name, refilling the bag when it is empty"""
+        if not self.bag:
+            random.shuffle(self.keys)
+            self.bag.extend(self.keys)
+        return self.bag.popleft()
 
 class Tetromino:
     # Tetromino shapes and their rotations
@@ -120,6 +174,9 @@ class Tetromino:
         ]
     }
     
+    # Shape names in a fixed order
+    _KEYS = tuple(SHAPES.keys())
+    
     # Default colors for each shape
     DEFAULT_COLORS = {
         'I': (0, 255, 255),   # Cyan
@@ -131,10 +188,42 @@ class Tetromino:
         'Z': (255, 0, 0)      # Red
     }
     
-    def __init__(self):
-        """Initialize a new tetromino piece"""
-        # Randomly select a shape
-        self.shape_name = random.choice(list(self.SHAPES.keys()))
+    # Rotation reached by rotating clockwise from each rotation of each shape
+    _NEXT_ROT = {
+        name: tuple((i + 1) % len(rotations) for i in range(len(rotations)))
+        for name, rotations in SHAPES.items()
+    }
+    
+    # SRS wall kicks: (dx, dy) offsets tried in order for each (from, to)
+    # rotation, with y pointing down as on the board
+    _JLSTZ_KICKS = {
+        (0, 1): ((0, 0), (-1, 0), (-1, -1), (0, 2), (-1, 2)),
+        (1, 2): ((0, 0), (1, 0), (1, 1), (0, -2), (1, -2)),
+        (2, 3): ((0, 0), (1, 0), (1, -1), (0, 2), (1, 2)),
+        (3, 0): ((0, 0), (-1, 0), (-1, 1), (0, -2), (-1, -2))
+    }
+    _I_KICKS = {
+        (0, 1): ((0, 0), (-2, 0), (1, 0), (-2, 1), (1, -2)),
+        (1, 2): ((0, 0), (-1, 0), (2, 0), (-1, -2), (2, 1)),
+        (2, 3): ((0, 0), (2, 0), (-1, 0), (2, -1), (-1, 2)),
+        (3, 0): ((0, 0), (1, 0), (-2, 0), (1, 2), (-2, -1))
+    }
+    _O_KICKS = {
+        (0, 0): ((0, 0),)
+    }
+    _KICKS = {
+        'I': _I_KICKS,
+        'J': _JLSTZ_KICKS,
+        'L': _JLSTZ_KICKS,
+        'O': _O_KICKS,
+        'S': _JLSTZ_KICKS,
+        'T': _JLSTZ_KICKS,
+        'Z': _JLSTZ_KICKS
+    }
+    
+    def __init__(self, shape_name=None):
+        """Initialize a new tetromino piece, dealing its shape from the 7-bag unless given"""
+        self.shape_name = shape_name if shape_name is not None else next(_bag)
         self.shape = self.SHAPES[self.shape_name]
         self.color = self.DEFAULT_COLORS[self.shape_name]
         self.rotation = 0
@@ -143,6 +232,20 @@ class Tetromino:
         self.x = 3
         self.y = 0
     
+    def fast_clone(self):
+        """
+        Create a shallow copy of the piece
+        Much cheaper than copy.deepcopy since the shape tables are shared and never mutated
+        """
+        clone = Tetromino.__new__(Tetromino)
+        clone.shape_name = self.shape_name
+        clone.shape = self.shape
+        clone.color = self.color
+        clone.rotation = self.rotation
+        clone.x = self.x
+        clone.y = self.y
+        return clone
+    
     def update_colors(self, theme_colors):
         """Update the piece color based on the current theme"""
         if self.shape_name in theme_colors:
@@ -152,42 +255,28 @@ class Tetromino:
         """Get the current rotation of the shape"""
         return self.shape[self.rotation]
     
+    def meta(self):
+        """Get the precomputed metadata of the current rotation"""
+        return ROTATION_META[self.shape_name][self.rotation]
+    
     def rotate(self, board):
-        """Rotate the tetromino if possible"""
-        old_rotation = self.rotation
-        self.rotation = (self.rotation + 1) % len(self.shape)
+        """
+        Rotate the tetromino clockwise if possible
+        The SRS wall kicks are tried in order without moving the piece, which
+        only moves once a free position is found
+        """
+        target_rotation = self._NEXT_ROT[self.shape_name][self.rotation]
+        target_meta = ROTATION_META[self.shape_name][target_rotation]
         
-        # Check if rotation is valid
-        if board.is_collision(self):
-            # Try wall kicks - shift left or right if rotation against wall
-            original_x = self.x
-            
-            # Try shifting right
-            self.x += 1
-            if not board.is_collision(self):
-                return True
-                
-            # Try shifting left
-            self.x = original_x - 1
-            if not board.is_collision(self):
-                return True
-                
-            # Try shifting two spaces right (for I piece)
-            self.x = original_x + 2
-            if not board.is_collision(self):
-                return True
-                
-            # Try shifting two spaces left (for I piece)
-            self.x = original_x - 2
-            if not board.is_collision(self):
+        for dx, dy in self._KICKS[self.shape_name][(self.rotation, target_rotation)]:
+            if not board.is_collision_at(target_meta, self.x + dx, self.y + dy):
+                self.rotation = target_rotation
+                self.x += dx
+                self.y += dy
                 return True
-            
-            # If all wall kicks fail, revert rotation and position
-            self.x = original_x
-            self.rotation = old_rotation
-            return False
-            
-        return True
+        
+        # If all wall kicks fail, the piece keeps its rotation and position
+        return False
     
     def move_left(self, board):
         """Move the tetromino left if possible"""
@@ -207,13 +296,23 @@ class Tetromino:
     
     def move_down(self, board):
         """Move the tetromino down if possible"""
+        # Moving down never changes the columns, so the walls need no checking
         self.y += 1
-        if board.is_collision(self):
+        if board.is_collision(self, check_walls=False):
             self.y -= 1
             return False
         return True
     
     def hard_drop(self, board):
         """Drop the tetromino to the bottom"""
-        while self.move_down(board):
-            pass
+        # The landing row is found in one call instead of a move per row
+        self.y = board.drop_y(self)
+
+# Shared randomizer every new piece is dealt from
+_bag = _BagGenerator(Tetromino._KEYS)
+
+# Metadata for every shape and rotation, built once at import
+ROTATION_META = {
+    name: tuple(_rotation_meta(rotation) for rotation in rotations)
+    for name, rotations in Tetromino.SHAPES.items()
+}
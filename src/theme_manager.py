@@ -4,6 +4,55 @@ Handles different visual themes and audio settings
 """
 import pygame
 import os
+from src.tetromino import ROTATION_META
+
+class PieceSpriteCache:
+    def __init__(self, theme_manager):
+        """Initialize the cache of pre-rendered piece sprites"""
+        self.theme_manager = theme_manager
+        
+        # Sprites keyed by (shape, rotation, color, half size); the cache only
+        # holds sprites for one theme and cell size at a time
+        self._sprites = {}
+        self._cache_key = None
+    
+    def get(self, piece, cell_size, rotation=None, half=False):
+        """
+        Get a sprite with every block of the piece drawn on it
+        The sprite's top left corner is the top left of the rotation's shape
+        grid; half draws the blocks at half size, as in the next piece preview
+        """
+        theme_name = self.theme_manager.current_theme_name
+        if (theme_name, cell_size) != self._cache_key:
+            self._sprites.clear()
+            self._cache_key = (theme_name, cell_size)
+        
+        if rotation is None:
+            rotation = piece.rotation
+        
+        key = (piece.shape_name, rotation, piece.color, half)
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            sprite = self._render(ROTATION_META[piece.shape_name][rotation]['cells'], piece.color, cell_size, half)
+            self._sprites[key] = sprite
+        return sprite
+    
+    def _render(self, cells, color, cell_size, half):
+        """Draw the blocks of a piece onto a transparent sprite in the display format"""
+        border_color = self.theme_manager.current_theme['border_color']
+        block_size = cell_size // 2 - 1 if half else cell_size - 1
+        positions = [
+            (x * cell_size // 2, y * cell_size // 2) if half else (x * cell_size, y * cell_size)
+            for x, y in cells
+        ]
+        
+        width = max(x for x, _ in positions) + block_size
+        height = max(y for _, y in positions) + block_size
+        sprite = pygame.Surface((width, height), pygame.SRCALPHA).convert_alpha()
+        for pos_x, pos_y in positions:
+            pygame.draw.rect(sprite, color, (pos_x, pos_y, block_size, block_size))
+            pygame.draw.rect(sprite, border_color, (pos_x, pos_y, block_size, block_size), 1)
+        return sprite
 
 class ThemeManager:
     def __init__(self):
@@ -66,12 +115,27 @@ class ThemeManager:
             }
         }
         
+        # Lighter UI colors for hovered buttons and the semi-transparent ghost
+        # piece colors, computed once per theme
+        for theme in self.themes.values():
+            theme['ui_color_hover'] = self._lighten(theme['ui_color'])
+            theme['text_color_hover'] = self._lighten(theme['text_color'])
+            theme['ghost_colors'] = {
+                name: (*color, theme['ghost_alpha'])
+                for name, color in theme['piece_colors'].items()
+            }
+        
         # Set default theme
         self.current_theme_name = 'Neon'
         self.current_theme = self.themes[self.current_theme_name]
         
-        # Load sounds
+        # Pre-rendered piece sprites for the current theme
+        self.piece_sprites = PieceSpriteCache(self)
+        
+        # Sounds are only loaded when first played, so startup does not wait
+        # on the mixer and sounds that are never played are never loaded
         self.sounds = {}
+        self._sound_paths = {}
         self._load_sounds()
         
         # Audio state
@@ -79,8 +143,12 @@ class ThemeManager:
         self.music_enabled = True
         self.current_music = None
     
+    def _lighten(self, color, amount=50):
+        """Get a lighter version of a color, clamped to the valid range"""
+        return tuple(min(255, channel + amount) for channel in color)
+    
     def _load_sounds(self):
-        """Load sound effects"""
+        """Find the available sound effects, which are loaded lazily by _get_sound"""
         sound_dir = os.path.join('assets', 'sounds')
         
         # Check if directory exists
@@ -97,14 +165,35 @@ class ThemeManager:
             'select': 'select.wav'  # Added for menu selection
         }
         
-        # Load available sounds
+        # Remember the available sounds
         for name, filename in sound_files.items():
             path = os.path.join(sound_dir, filename)
             if os.path.exists(path):
-                try:
-                    self.sounds[name] = pygame.mixer.Sound(path)
-                except:
-                    print(f"Could not load sound: {path}")
+                self._sound_paths[name] = path
+    
+    def _get_sound(self, name):
+        """Get a sound effect, loading and caching it on first use (None if unavailable)"""
+        if name in self.sounds:
+            return self.sounds[name]
+        
+        path = self._sound_paths.get(name)
+        if path is None:
+            return None
+        
+        # Without an initialized mixer no sound can load; nothing is cached so
+        # the sound is still loaded once the mixer is up
+        if not pygame.mixer.get_init():
+            return None
+        
+        sound = None
+        try:
+            sound = pygame.mixer.Sound(path)
+        except:
+            print(f"Could not load sound: {path}")
+        
+        # Failed loads are cached too, so they are not retried on every play
+        self.sounds[name] = sound
+        return sound
     
     def cycle_theme(self):
         """Switch to the next available theme"""
@@ -125,8 +214,10 @@ class ThemeManager:
     
     def play_sound(self, sound_name):
         """Play a sound effect if available and enabled"""
-        if self.sound_enabled and sound_name in self.sounds:
-            self.sounds[sound_name].play()
+        if self.sound_enabled:
+            sound = self._get_sound(sound_name)
+            if sound is not None:
+                sound.play()
     
     def toggle_sound(self):
         """Toggle sound effects on/off"""